@@ -1,32 +1,45 @@
 """Build orchestration: sync, parse, chunk, embed, and persist documentation"""
 
 import asyncio
+import multiprocessing
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import UTC, datetime
 from pathlib import Path
 
+import orjson
 from dotenv import load_dotenv
 
 from src.config import config
+from src.models.chunk import DocumentationChunk
 from src.models.source import DocumentationSource
+from src.services.chunk_cache import ChunkCache
 from src.services.chunker import Chunker
-from src.services.doc_parser import DocParser
+from src.services.doc_parser import DocParser, ParsedContent
 from src.services.doc_sync import DocSync
 from src.services.embedder import Embedder
+from src.services.embedding_cache import EmbeddingCache
+from src.services.example_parser import ExampleParser
 from src.services.github_fetcher import GitHubFetcher
+from src.services.html_parser import HtmlParser
 from src.services.vector_store import VectorStore
 from src.utils.sources_loader import load_sources_config
 
+# Number of chunks embedded and written per database transaction
+PERSIST_BATCH_SIZE = 1000
+
+# Number of threads writing fetched GitHub files to the cache
+CACHE_WRITE_WORKERS = 8
+
 
 async def _initialize_services(db_path: str):
     """Initialize all required services"""
-    doc_parser = DocParser()
-    chunker = Chunker()
-
     # Initialize embedder (downloads model if not cached)
     print(f"  Loading embedding model: {config.embedding_model}")
     print(f"  Cache directory: {config.fastembed_cache_dir}")
     embedder = Embedder()
-    embedder.download_model()  # Ensure model is cached
+    embedder.warm_up()  # Model is downloaded by Embedder(); run it once
     print(f"✓ Embedding model ready (dimension: {config.embedding_dimension})")
 
     vector_store = VectorStore(db_path=db_path)
@@ -38,10 +51,10 @@ async def _initialize_services(db_path: str):
         print(f"✗ Failed to initialize database: {e}")
         raise
 
-    return doc_parser, chunker, embedder, vector_store
+    return embedder, vector_store
 
 
-async def _sync_website(website_source, fetching_config):
+async def _sync_website(website_source, fetching_config, force_refresh):
     """Sync documentation from a website source"""
     print(f"\n  Fetching from website: {website_source.name}")
     print(f"  URL: {website_source.url}")
@@ -54,7 +67,6 @@ async def _sync_website(website_source, fetching_config):
             fetching_config=fetching_config,
         )
 
-        force_refresh = False
         page_count, sync_id = await doc_sync.sync_docs(
             force_refresh=force_refresh, incremental=True
         )
@@ -66,7 +78,7 @@ async def _sync_website(website_source, fetching_config):
         raise
 
 
-async def _sync_github_repo(github_fetcher, chunker, github_source):
+async def _sync_github_repo(github_fetcher, github_source):
     """Sync documentation from a GitHub repository"""
     print(f"\n  Fetching from GitHub: {github_source.name}")
     print(f"  Repo: {github_source.repo_owner}/{github_source.repo_name}")
@@ -75,18 +87,9 @@ async def _sync_github_repo(github_fetcher, chunker, github_source):
         # Fetch files from GitHub
         results, cache_base_path = await github_fetcher.fetch_repo_files(github_source)
 
-        # Create cache directory
-        cache_dir = Path(cache_base_path)
-        cache_dir.mkdir(parents=True, exist_ok=True)
-
-        # Save markdown files to cache
+        # Save markdown files to cache (off the event loop)
         successful_results = [r for r in results if r.success]
-
-        for result in successful_results:
-            # Save to cache
-            file_path = cache_dir / result.path
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(result.content, encoding="utf-8")
+        await asyncio.to_thread(_write_cache_files, Path(cache_base_path), successful_results)
 
         print(
             f"  ✓ Fetched {len(successful_results)}/{len(results)} files from {github_source.name}"
@@ -98,22 +101,103 @@ async def _sync_github_repo(github_fetcher, chunker, github_source):
         raise
 
 
-async def _sync_all_sources(sources_config):
+def _write_cache_files(cache_dir: Path, results) -> None:
+    """Write fetched GitHub files into the cache directory"""
+    files = [(cache_dir / result.path, result.content.encode("utf-8")) for result in results]
+
+    # Create each directory once, then overlap the writes in a thread pool
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for directory in {file_path.parent for file_path, _ in files}:
+        directory.mkdir(parents=True, exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=CACHE_WRITE_WORKERS) as pool:
+        list(pool.map(lambda item: item[0].write_bytes(item[1]), files))
+
+
+def _handle_source_error(error: BaseException) -> None:
+    """
+    Re-raise a source sync failure unless the build skips failed sources
+
+    The failing sync has already reported which source failed. Pages it cached
+    in earlier builds stay on disk and are still parsed.
+    """
+    if config.fail_on_source_error or not isinstance(error, Exception):
+        raise error
+
+
+async def _gather_sources(coros):
+    """
+    Run source sync coroutines concurrently, bounded by config.max_parallel_sources
+
+    Every source is allowed to finish even if another one fails. Failed sources
+    come back as None, or the first failure is re-raised when
+    config.fail_on_source_error is set.
+    """
+    semaphore = asyncio.Semaphore(config.max_parallel_sources)
+
+    async def _bounded(coro):
+        async with semaphore:
+            return await coro
+
+    results = await asyncio.gather(*[_bounded(coro) for coro in coros], return_exceptions=True)
+
+    for index, result in enumerate(results):
+        if isinstance(result, BaseException):
+            _handle_source_error(result)
+            results[index] = None
+
+    return results
+
+
+async def _sync_websites(enabled_websites, fetching_config, force_refresh):
+    """
+    Sync website sources one after another
+
+    All websites share the same cache directory and metadata.json, and each
+    sync rewrites metadata.json from its own in-memory copy. Running them
+    concurrently would let the last writer drop the others' page entries, so
+    they are synced sequentially. Failed websites come back as None.
+    """
+    results = []
+    for website in enabled_websites:
+        try:
+            results.append(await _sync_website(website, fetching_config, force_refresh))
+        except Exception as e:
+            _handle_source_error(e)
+            results.append(None)
+    return results
+
+
+async def _sync_all_sources(sources_config, force_refresh):
     """Sync documentation from all enabled sources"""
-    print("\n[3/8] Fetching documentation from all sources...")
+    print("\n[3/7] Fetching documentation from all sources...")
 
     github_fetcher = GitHubFetcher(sources_config.github)
-    chunker = Chunker()
 
     all_sources_data = []
 
     try:
-        # Sync all enabled websites
         enabled_websites = sources_config.get_enabled_websites()
-        print(f"\nProcessing {len(enabled_websites)} website source(s)...")
+        enabled_repos = sources_config.get_enabled_github_repos()
+        print(
+            f"\nProcessing {len(enabled_websites)} website source(s) and "
+            f"{len(enabled_repos)} GitHub repository source(s)..."
+        )
+
+        # Websites (as one sequential task) and GitHub repos sync concurrently
+        website_results, *repo_results = await _gather_sources(
+            [
+                _sync_websites(enabled_websites, sources_config.fetching, force_refresh),
+                *[_sync_github_repo(github_fetcher, repo) for repo in enabled_repos],
+            ]
+        )
 
-        for website in enabled_websites:
-            page_count, sync_id = await _sync_website(website, sources_config.fetching)
+        failed_sources = []
+        for website, website_result in zip(enabled_websites, website_results, strict=True):
+            if website_result is None:
+                failed_sources.append(website.name)
+                continue
+            page_count, sync_id = website_result
             all_sources_data.append(
                 {
                     "type": "website",
@@ -124,12 +208,11 @@ async def _sync_all_sources(sources_config):
                 }
             )
 
-        # Sync all enabled GitHub repos
-        enabled_repos = sources_config.get_enabled_github_repos()
-        print(f"\nProcessing {len(enabled_repos)} GitHub repository source(s)...")
-
-        for repo in enabled_repos:
-            results, cache_path = await _sync_github_repo(github_fetcher, chunker, repo)
+        for repo, repo_result in zip(enabled_repos, repo_results, strict=True):
+            if repo_result is None:
+                failed_sources.append(repo.name)
+                continue
+            results, cache_path = repo_result
             all_sources_data.append(
                 {
                     "type": "github",
@@ -141,82 +224,168 @@ async def _sync_all_sources(sources_config):
             )
 
         print(f"\n✓ Synced {len(all_sources_data)} sources total")
+        if failed_sources:
+            print(
+                f"⚠ Skipped {len(failed_sources)} source(s) that failed to sync: "
+                f"{', '.join(failed_sources)}"
+            )
         return all_sources_data
 
     finally:
         await github_fetcher.close()
 
 
-async def _parse_and_chunk_all_sources(chunker, sources_config):
+async def _parse_and_chunk_all_sources(sources_config):
     """Parse and chunk all content from all sources"""
-    print("\n[4/8] Parsing and chunking content from all sources...")
+    print("\n[4/7] Parsing and chunking content from all sources...")
 
     all_chunks = []
     total_files = 0
 
-    # Process website HTML files
     enabled_websites = sources_config.get_enabled_websites()
-    if enabled_websites:
-        print(f"\nProcessing HTML from {len(enabled_websites)} website source(s)...")
-        website_chunks, website_files = await _parse_and_chunk_websites(chunker)
-        all_chunks.extend(website_chunks)
-        total_files += website_files
-        print(f"  ✓ Created {len(website_chunks)} chunks from {website_files} HTML pages")
-
-    # Process GitHub markdown, YAML, and JSON files
     enabled_repos = sources_config.get_enabled_github_repos()
-    if enabled_repos:
-        print(f"\nProcessing files from {len(enabled_repos)} GitHub source(s)...")
-        github_chunks, github_files = await _parse_and_chunk_github(chunker, enabled_repos)
-        all_chunks.extend(github_chunks)
-        total_files += github_files
-        print(f"  ✓ Created {len(github_chunks)} chunks from {github_files} files")
+
+    # Parsing and chunking are CPU-bound, so files are processed in worker processes
+    # Files whose content is unchanged since a previous build come from the chunk cache
+    chunk_cache = ChunkCache()
+    try:
+        with ProcessPoolExecutor(
+            mp_context=multiprocessing.get_context("spawn"), initializer=_init_parse_worker
+        ) as pool:
+            # Process website HTML files
+            if enabled_websites:
+                print(f"\nProcessing HTML from {len(enabled_websites)} website source(s)...")
+                website_chunks, website_files = await _parse_and_chunk_websites(pool, chunk_cache)
+                all_chunks.extend(website_chunks)
+                total_files += website_files
+                print(f"  ✓ Created {len(website_chunks)} chunks from {website_files} HTML pages")
+
+            # Process GitHub markdown, YAML, and JSON files
+            if enabled_repos:
+                print(f"\nProcessing files from {len(enabled_repos)} GitHub source(s)...")
+                github_chunks, github_files = await _parse_and_chunk_github(
+                    pool, chunk_cache, enabled_repos
+                )
+                all_chunks.extend(github_chunks)
+                total_files += github_files
+                print(f"  ✓ Created {len(github_chunks)} chunks from {github_files} files")
+
+        # Every file has been looked up, so whatever this build did not touch is stale
+        pruned = chunk_cache.prune()
+        if pruned:
+            print(f"  Pruned {pruned} stale chunk cache entries")
+    finally:
+        chunk_cache.close()
 
     print(f"\n✓ Total: {len(all_chunks)} chunks from {total_files} files")
     return all_chunks, total_files
 
 
-async def _parse_and_chunk_websites(chunker):
+async def _run_parse_jobs(pool, chunk_cache: ChunkCache, jobs, label):
+    """
+    Parse and chunk files in the process pool
+
+    Files whose content, source URL, and kind match a previous build are taken
+    from the chunk cache instead of being parsed again.
+
+    Args:
+        pool: ProcessPoolExecutor running _init_parse_worker
+        chunk_cache: Cache of chunks from earlier builds
+        jobs: List of (file_path, source_url, kind) tuples
+        label: Description used in progress output
+
+    Returns:
+        list[DocumentationChunk]: Chunks from all files, in job order
+    """
+    loop = asyncio.get_running_loop()
+    results: list[list[DocumentationChunk]] = [[] for _ in jobs]
+
+    keys = await asyncio.to_thread(_file_cache_keys, jobs)
+    cached = chunk_cache.get_many([key for key in keys if key is not None])
+    new_entries: list[tuple[bytes, list[DocumentationChunk]]] = []
+
+    async def _run(index, file_path, source_url, kind):
+        key = keys[index]
+        if key in cached:
+            results[index] = cached[key]
+            return
+        try:
+            results[index] = await loop.run_in_executor(
+                pool, _parse_chunk_file, str(file_path), source_url, kind
+            )
+            if key is not None:
+                new_entries.append((key, results[index]))
+        except Exception as e:
+            print(f"    ⚠ Warning: Failed to process {file_path.name}: {e}")
+
+    # Report progress about 20 times per run rather than every 10 files
+    progress_every = max(10, len(jobs) // 20)
+
+    tasks = [_run(index, *job) for index, job in enumerate(jobs)]
+    for i, task in enumerate(asyncio.as_completed(tasks), start=1):
+        await task
+
+        # Progress update
+        if i % progress_every == 0 or i == len(jobs):
+            print(f"    Processed {i}/{len(jobs)} {label}...")
+
+    chunk_cache.put_many(new_entries)
+    reused = sum(1 for key in keys if key in cached)
+    if reused:
+        print(f"    Reused cached chunks for {reused}/{len(jobs)} unchanged {label}")
+
+    return [chunk for chunks in results for chunk in chunks]
+
+
+def _file_cache_keys(jobs) -> list[bytes | None]:
+    """Compute chunk cache keys for parse jobs (None for unreadable files)"""
+    keys: list[bytes | None] = []
+    for file_path, source_url, kind in jobs:
+        try:
+            keys.append(ChunkCache.file_key(file_path.read_bytes(), source_url, kind))
+        except OSError:
+            # Let the worker report the failure
+            keys.append(None)
+    return keys
+
+
+async def _parse_and_chunk_websites(pool, chunk_cache: ChunkCache):
     """Parse and chunk all HTML pages from website cache"""
     cache_path = Path(config.docs_website_cache_path)
     pages_path = cache_path / "pages"
-    html_files = list(pages_path.glob("*.html")) if pages_path.exists() else []
+    html_files = await asyncio.to_thread(_find_html_files, pages_path)
 
     if not html_files:
         return [], 0
 
-    # Load cache metadata to get URL mappings
-    url_to_hash = _load_url_mappings(cache_path)
+    # Load cache metadata to get URL mappings (off the event loop)
+    url_to_hash = await asyncio.to_thread(_load_url_mappings, cache_path)
 
-    # Initialize HTML parser
-    from src.services.html_parser import HtmlParser
+    jobs = []
+    for html_file in html_files:
+        url_hash = html_file.stem
+        source_url = url_to_hash.get(url_hash, f"https://unknown.local/{url_hash}")
+        jobs.append((html_file, source_url, "html"))
 
-    html_parser = HtmlParser()
+    all_chunks = await _run_parse_jobs(pool, chunk_cache, jobs, "HTML pages")
+    return all_chunks, len(html_files)
 
-    all_chunks = []
-    for i, html_file in enumerate(html_files, start=1):
-        try:
-            chunks = await _process_html_file(html_file, url_to_hash, html_parser, chunker)
-            all_chunks.extend(chunks)
 
-            # Progress update
-            if i % 10 == 0 or i == len(html_files):
-                print(f"    Processed {i}/{len(html_files)} HTML pages...")
+def _find_html_files(pages_path: Path) -> list[Path]:
+    """List cached HTML pages using a single scandir pass"""
+    if not pages_path.exists():
+        return []
 
-        except Exception as e:
-            print(f"    ⚠ Warning: Failed to process {html_file.name}: {e}")
-            continue
-
-    return all_chunks, len(html_files)
+    with os.scandir(pages_path) as entries:
+        return [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(".html") and entry.is_file(follow_symlinks=False)
+        ]
 
 
-async def _parse_and_chunk_github(chunker, github_sources):
+async def _parse_and_chunk_github(pool, chunk_cache: ChunkCache, github_sources):
     """Parse and chunk markdown, YAML, and JSON files from GitHub repositories"""
-    from src.services.doc_parser import DocParser
-    from src.services.example_parser import ExampleParser
-
-    doc_parser = DocParser()
-    example_parser = ExampleParser()
     all_chunks = []
     total_files = 0
 
@@ -229,177 +398,248 @@ async def _parse_and_chunk_github(chunker, github_sources):
         if not cache_dir.exists():
             continue
 
-        # Find all markdown files
-        md_files = list(cache_dir.glob("**/*.md"))
-        # Find all YAML files (including .example files)
-        yaml_files = (
-            list(cache_dir.glob("**/*.yaml"))
-            + list(cache_dir.glob("**/*.yml"))
-            + list(cache_dir.glob("**/*.yaml.example"))
-            + list(cache_dir.glob("**/*.yml.example"))
-        )
-        # Find all JSON files (including .example files)
-        json_files = list(cache_dir.glob("**/*.json")) + list(cache_dir.glob("**/*.json.example"))
-
-        all_files = md_files + yaml_files + json_files
+        # Find all markdown, YAML, and JSON files in a single directory walk
+        all_files = await asyncio.to_thread(_find_github_files, cache_dir)
         total_files += len(all_files)
 
-        for i, file_path in enumerate(all_files, start=1):
-            try:
-                # Read file content
-                file_content = file_path.read_text(encoding="utf-8")
-
-                # Determine parser based on file extension
-                # Handle .example suffix files (e.g., config.yaml.example)
-                ext = file_path.suffix.lower()
-                if ext == ".example":
-                    # Get the previous extension (e.g., .yaml from config.yaml.example)
-                    ext = Path(file_path.stem).suffix.lower()
-
-                if ext == ".md":
-                    # Parse markdown
-                    parsed = await doc_parser.parse(file_content)
-                elif ext in (".yaml", ".yml", ".json"):
-                    # Parse YAML or JSON
-                    parsed = await example_parser.parse(file_path, file_content)
-                else:
-                    # Skip unknown file types
-                    continue
-
-                # Create source URL (GitHub file URL)
-                relative_path = file_path.relative_to(cache_dir)
-                source_url = (
-                    f"https://github.com/{source.repo_owner}/{source.repo_name}/"
-                    f"blob/{source.branch or 'main'}/{relative_path}"
-                )
+        jobs = []
+        for file_path, kind in all_files:
+            # Create source URL (GitHub file URL)
+            relative_path = file_path.relative_to(cache_dir)
+            source_url = (
+                f"https://github.com/{source.repo_owner}/{source.repo_name}/"
+                f"blob/{source.branch or 'main'}/{relative_path}"
+            )
+            jobs.append((file_path, source_url, kind))
 
-                # Chunk the parsed content
-                chunks = await chunker.chunk(parsed, source_url)
-                all_chunks.extend(chunks)
+        all_chunks.extend(
+            await _run_parse_jobs(pool, chunk_cache, jobs, f"files from {source.name}")
+        )
 
-                # Progress update
-                if i % 10 == 0 or i == len(all_files):
-                    print(f"    Processed {i}/{len(all_files)} files from {source.name}...")
+    return all_chunks, total_files
 
-            except Exception as e:
-                print(f"    ⚠ Warning: Failed to process {file_path.name}: {e}")
-                continue
 
-    return all_chunks, total_files
+def _find_github_files(cache_dir: Path) -> list[tuple[Path, str]]:
+    """
+    Find markdown, YAML, and JSON files (including .example files) in a GitHub cache
+
+    Returns:
+        List of (file_path, kind) tuples, markdown first, then YAML, then JSON.
+        kind is the parser used by _parse_chunk_file ('markdown' or 'example').
+    """
+    md_files, yaml_files, json_files = [], [], []
+    buckets = {".md": md_files, ".yaml": yaml_files, ".yml": yaml_files, ".json": json_files}
+
+    for root, _, file_names in os.walk(cache_dir):
+        for file_name in file_names:
+            file_path = Path(root) / file_name
+
+            # Handle .example suffix files (e.g., config.yaml.example)
+            ext = file_path.suffix.lower()
+            if ext == ".example":
+                # Get the previous extension (e.g., .yaml from config.yaml.example)
+                ext = Path(file_path.stem).suffix.lower()
+
+            bucket = buckets.get(ext)
+            if bucket is not None:
+                bucket.append(file_path)
+
+    return (
+        [(file_path, "markdown") for file_path in md_files]
+        + [(file_path, "example") for file_path in yaml_files]
+        + [(file_path, "example") for file_path in json_files]
+    )
 
 
 def _load_url_mappings(cache_path):
     """Load URL to hash mappings from cache metadata"""
     metadata_file = cache_path / "metadata.json"
-    url_to_hash = {}
 
-    if metadata_file.exists():
-        import json
+    if not metadata_file.exists():
+        return {}
 
-        metadata_json = json.loads(metadata_file.read_text(encoding="utf-8"))
-        for url, page_data in metadata_json.get("pages", {}).items():
-            url_hash = page_data.get("url_hash")
-            if url_hash:
-                url_to_hash[url_hash] = url
+    metadata_json = orjson.loads(metadata_file.read_bytes())
+    return {
+        page_data["url_hash"]: url
+        for url, page_data in metadata_json.get("pages", {}).items()
+        if page_data.get("url_hash")
+    }
 
-    return url_to_hash
 
+# Per-process parsers and chunker, created once by _init_parse_worker
+_worker_services: dict = {}
 
-async def _process_html_file(html_file, url_to_hash, html_parser, chunker):
-    """Process a single HTML file and return chunks"""
-    html_content = html_file.read_text(encoding="utf-8")
-    url_hash = html_file.stem
-    source_url = url_to_hash.get(url_hash, f"https://unknown.local/{url_hash}")
 
-    # Parse HTML content
-    parsed_html = html_parser.parse(html_content, source_url, validation=False)
+def _init_parse_worker() -> None:
+    """Create parsers and chunker once per worker process"""
+    _worker_services.update(
+        html_parser=HtmlParser(),
+        doc_parser=DocParser(),
+        example_parser=ExampleParser(),
+        chunker=Chunker(),
+    )
 
-    # Convert to format expected by Chunker
-    from src.services.doc_parser import ParsedContent as MarkdownParsedContent
 
-    # Don't create sections to avoid duplicate chunks
-    # Previously, this created one section per heading with the same content,
-    # resulting in N duplicate chunks for N headings
-    # Now we pass empty sections and let the chunker handle the full content once
-    markdown_parsed = MarkdownParsedContent(
-        text=parsed_html.main_content,
-        title=parsed_html.title,
-        sections=[],  # Empty - let chunker handle the full content
-        metadata=parsed_html.metadata,
-    )
+def _parse_chunk_file(file_path: str, source_url: str, kind: str) -> list[DocumentationChunk]:
+    """
+    Read, parse, and chunk a single file (runs inside a worker process)
 
-    return await chunker.chunk(markdown_parsed, source_url)
+    Args:
+        file_path: Path to the cached file
+        source_url: URL recorded as the chunks' source
+        kind: Parser to use ('html', 'markdown', or 'example')
 
+    Returns:
+        list[DocumentationChunk]: Chunks for the file
+    """
+    return asyncio.run(_parse_chunk_file_async(Path(file_path), source_url, kind))
 
-async def _generate_embeddings(embedder, all_chunks):
-    """Generate embeddings for all chunks"""
-    print("\n[5/8] Generating embeddings...")
-    print(f"Model: {config.embedding_model} (local, no API key required)")
-    print(f"Batch size: {config.embedding_batch_size}")
-    print(f"Embedding dimension: {config.embedding_dimension}")
 
-    try:
-        embeddings = await embedder.embed_batch(
-            [chunk.content for chunk in all_chunks],
-            batch_size=config.embedding_batch_size,
+async def _parse_chunk_file_async(
+    file_path: Path, source_url: str, kind: str
+) -> list[DocumentationChunk]:
+    """Async body of _parse_chunk_file"""
+    if kind == "html":
+        # The HTML parser reads the raw UTF-8 bytes itself, so skip building a str first
+        parsed_html = _worker_services["html_parser"].parse(
+            file_path.read_bytes(), source_url, validation=False
         )
-        print(f"✓ Generated {len(embeddings)} embeddings")
-        return embeddings
-    except Exception as e:
-        print(f"✗ Failed to generate embeddings: {e}")
-        print(f"  Error details: {str(e)}")
-        await embedder.close()
-        raise
 
+        # Don't create sections to avoid duplicate chunks
+        # Previously, this created one section per heading with the same content,
+        # resulting in N duplicate chunks for N headings
+        # Now we pass empty sections and let the chunker handle the full content once
+        parsed = ParsedContent(
+            text=parsed_html.main_content,
+            title=parsed_html.title,
+            sections=[],  # Empty - let chunker handle the full content
+            metadata=parsed_html.metadata,
+        )
+    elif kind == "markdown":
+        parsed = await _worker_services["doc_parser"].parse(file_path.read_text(encoding="utf-8"))
+    else:
+        file_content = file_path.read_text(encoding="utf-8")
+        parsed = await _worker_services["example_parser"].parse(file_path, file_content)
 
-async def _persist_to_database(vector_store: VectorStore, all_chunks, embeddings):
-    """Persist chunks and embeddings to database"""
-    print("\n[6/8] Persisting to database...")
+    return await _worker_services["chunker"].chunk(parsed, source_url)
 
-    try:
-        for i, (chunk, embedding) in enumerate(zip(all_chunks, embeddings, strict=True), start=1):
-            await vector_store.insert_chunk(chunk, embedding)
 
-            if i % 100 == 0 or i == len(all_chunks):
-                print(f"  Inserted {i}/{len(all_chunks)} chunks")
+async def _embed_with_cache(embedder, embedding_cache, chunks):
+    """
+    Embed chunks, reusing cached embeddings for content that has not changed
+
+    Returns:
+        Tuple of (embeddings in chunk order, number of newly generated embeddings)
+    """
+    keys = [EmbeddingCache.content_key(chunk.content) for chunk in chunks]
+    cached = embedding_cache.get_many(keys)
+
+    # Embed each distinct piece of content once; duplicated sidebars and
+    # README fragments share the embedding of their first occurrence
+    missing: dict[bytes, str] = {}
+    for key, chunk in zip(keys, chunks, strict=True):
+        if key not in cached and key not in missing:
+            missing[key] = chunk.content
+
+    new_embeddings = await embedder.embed_batch(
+        list(missing.values()),
+        batch_size=config.embedding_batch_size,
+    )
+    new_items = list(zip(missing, new_embeddings, strict=True))
+    embedding_cache.put_many(new_items)
+
+    # Fan embeddings back out to every chunk in order
+    cached.update(new_items)
+    embeddings = [cached[key] for key in keys]
+    return embeddings, len(new_embeddings)
 
-        print(f"✓ Persisted {len(all_chunks)} chunks to database")
-    except Exception as e:
-        print(f"✗ Failed to persist chunks: {e}")
-        raise
 
+def _build_metadata(total_files_count, all_chunks_count, all_sources_data) -> DocumentationSource:
+    """Build the metadata row describing this build"""
+    print("\n[5/7] Preparing metadata...")
 
-def _update_metadata(
-    vector_store: VectorStore, total_files_count, all_chunks_count, all_sources_data
+    # Store summary of all sources in metadata
+    sources_summary = "\n".join([f"{data['type']}: {data['name']}" for data in all_sources_data])
+
+    return DocumentationSource(
+        sources_summary=sources_summary,
+        local_path=config.docs_website_cache_path,
+        total_files=total_files_count,
+        total_chunks=all_chunks_count,
+        last_sync=datetime.now(UTC),
+    )
+
+
+async def _embed_and_persist(
+    embedder, vector_store: VectorStore, all_chunks, metadata: DocumentationSource, conn
 ):
-    """Update metadata in database"""
-    print("\n[7/8] Updating metadata...")
+    """
+    Generate embeddings and persist chunks and metadata to the database
+
+    Works one batch at a time so only a single batch of embeddings is held
+    in memory, instead of embedding everything before the first insert.
+    The metadata row is written in the last batch's transaction, so it can
+    never describe a different set of chunks than the one committed.
+    """
+    print("\n[6/7] Generating embeddings and persisting to database...")
+    print(f"Model: {config.embedding_model} (local, no API key required)")
+    print(f"Batch size: {config.embedding_batch_size}")
+    print(f"Embedding dimension: {config.embedding_dimension}")
+
+    embedding_cache = EmbeddingCache()
+    generated_count = 0
 
     try:
-        # Store summary of all sources in metadata
-        sources_summary = "\n".join(
-            [f"{data['type']}: {data['name']}" for data in all_sources_data]
-        )
+        # One transaction per batch instead of one per chunk
+        batch_starts = range(0, len(all_chunks), PERSIST_BATCH_SIZE)
+        for start in batch_starts:
+            batch = all_chunks[start : start + PERSIST_BATCH_SIZE]
+            embeddings, new_count = await _embed_with_cache(embedder, embedding_cache, batch)
+            is_last = start == batch_starts[-1]
+            await vector_store.insert_chunks_batch(
+                batch, embeddings, conn=conn, metadata=metadata if is_last else None
+            )
+            generated_count += new_count
+            print(f"  Persisted {start + len(batch)}/{len(all_chunks)} chunks")
 
-        metadata = DocumentationSource(
-            sources_summary=sources_summary,
-            local_path=config.docs_website_cache_path,
-            total_files=total_files_count,
-            total_chunks=all_chunks_count,
-        )
+        if not all_chunks:
+            vector_store.update_metadata(metadata, conn=conn)
 
-        vector_store.update_metadata(metadata)
-        print("✓ Metadata updated")
+        print(
+            f"✓ Generated {generated_count} embeddings "
+            f"({len(all_chunks) - generated_count} reused from cache)"
+        )
+        print(f"✓ Persisted {len(all_chunks)} chunks and metadata to database")
     except Exception as e:
-        print(f"⚠ Warning: Failed to update metadata: {e}")
+        print(f"✗ Failed to embed and persist chunks: {e}")
+        raise
+    finally:
+        embedding_cache.close()
+
+
+def _directory_size(path: Path) -> int:
+    """
+    Total size of regular files under a directory
+
+    Uses os.scandir so sizes come from cached DirEntry data. Symlinks are not
+    followed, so files linked from a model snapshot are only counted once.
+    """
+    total = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                total += _directory_size(Path(entry.path))
+            elif entry.is_file(follow_symlinks=False):
+                total += entry.stat(follow_symlinks=False).st_size
+    return total
 
 
 def _verify_model_cache():
     """Verify model cache and display information"""
-    print("\n[8/8] Verifying model cache...")
+    print("\n[7/7] Verifying model cache...")
     cache_path = Path(config.fastembed_cache_dir)
     if cache_path.exists():
-        cache_size = sum(f.stat().st_size for f in cache_path.rglob("*") if f.is_file())
+        cache_size = _directory_size(cache_path)
         cache_size_mb = cache_size / (1024 * 1024)
         print(f"✓ Model cached: {cache_size_mb:.1f} MB in {config.fastembed_cache_dir}")
     else:
@@ -438,6 +678,7 @@ def _print_build_summary(total_files_count, all_chunks_count, all_sources_data):
 async def build(
     sources_config_path: str = "sources.yaml",
     db_path: str | None = None,
+    force_refresh: bool = False,
 ) -> None:
     """
     Complete build process: sync → parse → chunk → embed → persist
@@ -447,6 +688,7 @@ async def build(
     Args:
         sources_config_path: Path to sources configuration YAML file
         db_path: Optional custom database path (uses config.db_path if None)
+        force_refresh: Refetch every website page instead of only new or stale ones
 
     Raises:
         Exception: If any step of the build process fails
@@ -462,29 +704,28 @@ async def build(
 
     try:
         # Load sources configuration
-        print("\n[1/8] Loading sources configuration...")
+        print("\n[1/7] Loading sources configuration...")
         sources_config = load_sources_config(sources_config_path)
         print(f"✓ Loaded configuration from {sources_config_path}")
 
         # Initialize services
-        print("\n[2/8] Initializing services...")
+        print("\n[2/7] Initializing services...")
         db_path = db_path or config.db_path
-        doc_parser, chunker, embedder, vector_store = await _initialize_services(db_path)
+        embedder, vector_store = await _initialize_services(db_path)
 
         # Sync documentation from all sources
-        all_sources_data = await _sync_all_sources(sources_config)
+        all_sources_data = await _sync_all_sources(sources_config, force_refresh)
 
         # Parse and chunk pages from all sources
-        all_chunks, total_files_count = await _parse_and_chunk_all_sources(chunker, sources_config)
-
-        # Generate embeddings
-        embeddings = await _generate_embeddings(embedder, all_chunks)
+        all_chunks, total_files_count = await _parse_and_chunk_all_sources(sources_config)
 
-        # Persist to database
-        await _persist_to_database(vector_store, all_chunks, embeddings)
+        # Describe the build before persisting so the row joins the last chunk batch
+        metadata = _build_metadata(total_files_count, len(all_chunks), all_sources_data)
 
-        # Update metadata
-        _update_metadata(vector_store, total_files_count, len(all_chunks), all_sources_data)
+        # Chunks and metadata are written over one bulk-load connection
+        with vector_store.bulk_load_connection() as conn:
+            # Generate embeddings and persist to database
+            await _embed_and_persist(embedder, vector_store, all_chunks, metadata, conn)
 
         # Verify model cache
         _verify_model_cache()
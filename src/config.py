@@ -19,6 +19,10 @@ class AppConfig(BaseSettings):
     db_temp_path: str = Field(
         default="./.cache/docs.db.new", description="Temporary database path for refresh operations"
     )
+    db_full_integrity_check: bool = Field(
+        default=False,
+        description="Run PRAGMA integrity_check instead of quick_check before swapping databases",
+    )
     vector_distance_metric: str = Field(
         default="cosine", description="Distance metric for vector similarity (cosine, l2, ip)"
     )
@@ -36,6 +40,20 @@ class AppConfig(BaseSettings):
     embedding_dimension: int = Field(
         default=384, description="Embedding vector dimension (384 for bge-small-en-v1.5)"
     )
+    embedding_threads: int = Field(
+        default=6, ge=1, le=256, description="ONNX Runtime intra-op threads for embedding"
+    )
+    embedding_providers: list[str] = Field(
+        default_factory=list,
+        description=(
+            "ONNX Runtime execution providers in priority order, e.g. "
+            '["CUDAExecutionProvider", "CPUExecutionProvider"] (empty uses the CPU default)'
+        ),
+    )
+    embedding_cache_path: str = Field(
+        default="./.cache/embedding_cache.db",
+        description="SQLite cache of embeddings keyed by chunk content hash",
+    )
 
     # Chunking
     chunk_size_tokens: int = Field(
@@ -51,6 +69,19 @@ class AppConfig(BaseSettings):
         description="Minimum chunk size in tokens - smaller sections will be aggregated",
     )
 
+    # Build
+    max_parallel_sources: int = Field(
+        default=4, ge=1, le=32, description="Maximum number of sources synced concurrently"
+    )
+    fail_on_source_error: bool = Field(
+        default=False,
+        description="Abort the build when a source fails to sync instead of skipping it",
+    )
+    chunk_cache_path: str = Field(
+        default="./.cache/chunk_cache.db",
+        description="SQLite cache of parsed chunks keyed by source file content hash",
+    )
+
     # MCP Server
     mcp_host: str = Field(default="0.0.0.0", description="MCP server bind address")
     mcp_port: int = Field(default=8080, ge=1024, le=65535, description="MCP server port")
@@ -60,6 +91,9 @@ class AppConfig(BaseSettings):
     query_result_limit: int = Field(
         default=5, ge=1, le=50, description="Default maximum number of search results"
     )
+    query_embedding_cache_size: int = Field(
+        default=2048, ge=0, description="Number of query embeddings kept in memory (0 disables)"
+    )
 
     # OpenTelemetry
     otel_enabled: bool = Field(default=True, description="Enable OpenTelemetry logging")
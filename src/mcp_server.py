@@ -1,17 +1,25 @@
 """MCP server implementation using fastmcp"""
 
+import asyncio
 import logging
+import os
 import threading
-from typing import Any
-from uuid import UUID
+from collections import OrderedDict
+from functools import partial
+from typing import Annotated, Any
 
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 from fastmcp import FastMCP
 from fastmcp.exceptions import McpError
 from mcp.types import ErrorData
-from starlette.responses import JSONResponse
+from pydantic import Field
+from starlette.middleware import Middleware
+from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from src.config import config
+from src.models.chunk import CHUNK_ID_RE
 from src.models.query import Query, QueryType
 from src.models.search_result import QueryDocsOutput
 from src.services.refresh_orchestrator import RefreshOrchestrator
@@ -20,8 +28,6 @@ from src.services.telemetry import get_telemetry_service
 from src.services.vector_store import VectorStore
 from src.utils.sources_loader import load_sources_config
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Initialize fastmcp server
@@ -38,6 +44,41 @@ _scheduler: BackgroundScheduler | None = None
 # Database swap lock - ensures atomic database swaps don't interfere with service init
 _db_swap_lock = threading.Lock()
 
+# Serializes first-request service initialization across coroutines
+_init_lock = asyncio.Lock()
+
+# Accepted query_type values
+_QUERY_TYPES: dict[str, QueryType] = {qt.value: qt for qt in QueryType}
+
+# Recently served get_chunk responses, dumped once and reused while the database file is
+# unchanged; keyed on the file's identity so swaps by other processes also invalidate it
+_CHUNK_DUMP_CACHE_SIZE = 1024
+_chunk_dumps: OrderedDict[str, dict[str, Any]] = OrderedDict()
+_chunk_dumps_db_key: tuple[int, int, int] | None = None
+
+# Health check body, encoded once and reused for every probe
+_HEALTH_BODY = b'{"status":"ok"}'
+_HEALTH_PATHS = frozenset({"/", "/health"})
+_HEALTH_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_HEALTH_BODY)).encode()),
+    (b"cache-control", b"no-store"),
+]
+
+
+class HealthCheckMiddleware:
+    """Answer health probes in raw ASGI, ahead of routing and the rest of the stack"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["method"] == "GET" and scope["path"] in _HEALTH_PATHS:
+            await send({"type": "http.response.start", "status": 200, "headers": _HEALTH_HEADERS})
+            await send({"type": "http.response.body", "body": _HEALTH_BODY})
+            return
+        await self.app(scope, receive, send)
+
 
 async def _get_services() -> tuple[VectorStore, SearchService]:
     """
@@ -47,32 +88,100 @@ async def _get_services() -> tuple[VectorStore, SearchService]:
     """
     global _vector_store, _search_service
 
-    # Acquire lock to prevent initialization during database swap
-    with _db_swap_lock:
-        if not _vector_store:
-            _vector_store = VectorStore(config.db_path)
-            await _vector_store.initialize()
-
-            # Check if database is initialized
-            if not await _vector_store.health_check():
-                raise McpError(
-                    ErrorData(
-                        code=-32001,
-                        message=(
-                            "Documentation database is not initialized. Run build process first."
-                        ),
+    # Fast path: once initialized, services are never reset (swaps replace the file
+    # behind the same path), so no lock is needed
+    if _vector_store is not None and _search_service is not None:
+        return _vector_store, _search_service
+
+    # One coroutine initializes at a time; the others wait without blocking the loop
+    async with _init_lock:
+        # Wait out any in-progress database swap without blocking the event loop
+        await _acquire_db_swap_lock()
+        try:
+            if not _vector_store:
+                _vector_store = VectorStore(config.db_path)
+                await _vector_store.initialize()
+
+                # Check if database is initialized
+                if not await _vector_store.health_check():
+                    raise McpError(
+                        ErrorData(
+                            code=-32001,
+                            message=(
+                                "Documentation database is not initialized. "
+                                "Run build process first."
+                            ),
+                        )
                     )
-                )
 
-        if not _search_service:
-            _search_service = SearchService(_vector_store)
+            if not _search_service:
+                _search_service = SearchService(_vector_store)
+        finally:
+            _db_swap_lock.release()
 
     return _vector_store, _search_service
 
 
+async def _acquire_db_swap_lock() -> None:
+    """
+    Acquire the threading lock shared with the refresh job from the event loop
+
+    A held lock is waited for in a worker thread, so the waiter resumes as soon
+    as the swap releases it. If the waiting request is cancelled, the thread
+    still takes the lock and hands it straight back.
+    """
+    if _db_swap_lock.acquire(blocking=False):
+        return
+
+    acquire = asyncio.ensure_future(asyncio.to_thread(_db_swap_lock.acquire))
+    try:
+        await asyncio.shield(acquire)
+    except asyncio.CancelledError:
+        acquire.add_done_callback(_release_db_swap_lock)
+        raise
+
+
+def _release_db_swap_lock(acquire: asyncio.Future) -> None:
+    """Release the swap lock taken by an acquire whose waiter was cancelled"""
+    if not acquire.cancelled() and acquire.exception() is None:
+        _db_swap_lock.release()
+
+
+def _reset_chunk_dumps() -> None:
+    """Drop cached get_chunk responses after the active database is swapped"""
+    global _chunk_dumps, _chunk_dumps_db_key
+    # Rebind rather than clear: in-flight requests keep writing to the old, discarded dict
+    _chunk_dumps = OrderedDict()
+    _chunk_dumps_db_key = None
+
+
+def _current_chunk_dumps() -> OrderedDict[str, dict[str, Any]] | None:
+    """
+    Cached get_chunk responses for the database file currently on disk
+
+    Returns:
+        The cache, emptied if the file was replaced or modified since it was filled,
+        or None when the database is not a file that can be stat'ed
+    """
+    global _chunk_dumps_db_key
+    try:
+        stat = os.stat(config.db_path)
+    except OSError:
+        return None
+
+    db_key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    if db_key != _chunk_dumps_db_key:
+        _reset_chunk_dumps()
+        _chunk_dumps_db_key = db_key
+    return _chunk_dumps
+
+
 @mcp.tool()
 async def query_docs(
-    query: str, limit: int = 5, query_type: str = "semantic", min_score: float | None = None
+    query: Annotated[str, Field(min_length=1)],
+    limit: Annotated[int, Field(ge=1, le=50)] = 5,
+    query_type: str = "semantic",
+    min_score: Annotated[float | None, Field(ge=0.0, le=1.0)] = None,
 ) -> QueryDocsOutput:
     """Search Stacklok documentation and return relevant snippets with relevance scores
 
@@ -94,10 +203,9 @@ async def query_docs(
         _, search_service = await _get_services()
 
         # Validate query_type
-        try:
-            qt = QueryType(query_type)
-        except ValueError as e:
-            error = e
+        qt = _QUERY_TYPES.get(query_type)
+        if qt is None:
+            error = ValueError(f"{query_type!r} is not a valid QueryType")
             raise McpError(
                 ErrorData(
                     code=-32602,
@@ -105,15 +213,18 @@ async def query_docs(
                         f"Invalid query_type: {query_type}. Must be: semantic, keyword, or hybrid"
                     ),
                 )
-            ) from e
+            )
 
-        # Create query object
-        query_obj = Query(text=query, limit=limit, query_type=qt, min_score=min_score)
+        # Arguments were already validated against the tool signature, so skip re-validation
+        query_obj = Query.model_construct(
+            text=query, limit=limit, query_type=qt, min_score=min_score
+        )
 
         # Execute search
         try:
             result = await search_service.query(query_obj)
-            response = result.model_dump()
+            # Dump to JSON-ready values only if telemetry actually records the response
+            response = partial(result.model_dump, mode="json")
             return result
         except Exception as e:
             error = e
@@ -150,13 +261,19 @@ async def get_chunk(chunk_id: str) -> dict[str, Any]:
 
     try:
         # Validate UUID format
-        try:
-            UUID(chunk_id)
-        except ValueError as e:
-            error = e
+        if not CHUNK_ID_RE.match(chunk_id):
+            error = ValueError(f"Invalid UUID format: {chunk_id}")
             raise McpError(
                 ErrorData(code=-32602, message=f"chunk_id must be a valid UUID, got: {chunk_id}")
-            ) from e
+            )
+
+        # Serve hot chunks without a database read or model dump
+        # Callers get a copy so changes to a response never reach the cache
+        dumps = _current_chunk_dumps()
+        if dumps is not None and (cached := dumps.get(chunk_id)) is not None:
+            dumps.move_to_end(chunk_id)
+            response = dict(cached)
+            return response
 
         # Get vector store
         vector_store, _ = await _get_services()
@@ -169,6 +286,10 @@ async def get_chunk(chunk_id: str) -> dict[str, Any]:
             raise McpError(ErrorData(code=-32002, message=f"Chunk with ID {chunk_id} not found"))
 
         response = chunk.model_dump()
+        if dumps is not None:
+            dumps[chunk_id] = dict(response)
+            if len(dumps) > _CHUNK_DUMP_CACHE_SIZE:
+                dumps.popitem(last=False)
         return response
 
     finally:
@@ -183,13 +304,17 @@ async def get_chunk(chunk_id: str) -> dict[str, Any]:
 
 
 # Health check endpoint
+# Probes are normally answered by HealthCheckMiddleware; these routes remain for apps built
+# without it (e.g. mcp.http_app() in tests).
 # Note: Both routes (/ and /health) point to the same function using double decorator pattern.
 # This provides flexibility for clients - they can use either the root path or the explicit
 # /health endpoint.
 @mcp.custom_route("/", methods=["GET"])
 @mcp.custom_route("/health", methods=["GET"])
 def health_check(request):
-    return JSONResponse({"status": "ok"})
+    return Response(
+        content=_HEALTH_BODY, media_type="application/json", headers={"cache-control": "no-store"}
+    )
 
 
 def _startup_sync() -> None:
@@ -203,10 +328,16 @@ def _startup_sync() -> None:
 
         if refresh_config.enabled:
             logger.info("Initializing background refresh orchestrator")
-            _scheduler = BackgroundScheduler()
+            # The refresh job is the only job, so size the pool to it rather than the default 10
+            _scheduler = BackgroundScheduler(
+                executors={"default": ThreadPoolExecutor(refresh_config.max_concurrent_jobs)},
+                job_defaults={"coalesce": True, "misfire_grace_time": 60},
+            )
 
             # Pass the db_swap_lock to coordinate with service initialization
-            _refresh_orchestrator = RefreshOrchestrator(db_swap_lock=_db_swap_lock)
+            _refresh_orchestrator = RefreshOrchestrator(
+                db_swap_lock=_db_swap_lock, on_swap=_reset_chunk_dumps
+            )
             _refresh_orchestrator.configure_scheduler_sync(
                 scheduler=_scheduler,
                 interval_hours=refresh_config.interval_hours,
@@ -218,7 +349,7 @@ def _startup_sync() -> None:
         else:
             logger.info("Background refresh is disabled")
     except Exception as e:
-        logger.error(f"Failed to start background refresh orchestrator: {e}")
+        logger.error("Failed to start background refresh orchestrator: %s", e)
         # Don't fail server startup if refresh fails to initialize
 
 
@@ -230,7 +361,7 @@ def _shutdown_sync() -> None:
         try:
             _refresh_orchestrator.stop_scheduler_sync()
         except Exception as e:
-            logger.error(f"Error shutting down refresh orchestrator: {e}")
+            logger.error("Error shutting down refresh orchestrator: %s", e)
 
     if _scheduler:
         try:
@@ -238,18 +369,26 @@ def _shutdown_sync() -> None:
             _scheduler.shutdown(wait=False)
             logger.info("Background refresh scheduler stopped")
         except Exception as e:
-            logger.error(f"Error shutting down scheduler: {e}")
+            logger.error("Error shutting down scheduler: %s", e)
 
 
 def main() -> None:
     """Entry point for the MCP server"""
+    # Configure logging here rather than at import so importers keep their own setup
+    logging.basicConfig(level=logging.INFO)
+
     # Initialize background refresh service synchronously
     _startup_sync()
 
     try:
         # Run server using FastMCP's built-in runner
         # CORS is handled automatically by FastMCP via streamable-http transport
-        mcp.run(transport="streamable-http", host="0.0.0.0", port=config.mcp_port)
+        mcp.run(
+            transport="streamable-http",
+            host="0.0.0.0",
+            port=config.mcp_port,
+            middleware=[Middleware(HealthCheckMiddleware)],
+        )
     finally:
         # Cleanup on shutdown
         _shutdown_sync()
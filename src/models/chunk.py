@@ -1,10 +1,16 @@
 """Documentation chunk data model"""
 
+import re
 from datetime import UTC, datetime
-from uuid import UUID, uuid4
+from uuid import uuid4
 
 from pydantic import BaseModel, Field, field_validator
 
+# Canonical UUID text form produced by str(uuid4()), used for chunk IDs
+CHUNK_ID_RE = re.compile(
+    r"\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z"
+)
+
 
 class DocumentationChunk(BaseModel):
     """A semantically meaningful segment of documentation text"""
@@ -31,8 +37,6 @@ class DocumentationChunk(BaseModel):
     @classmethod
     def validate_uuid(cls, v: str) -> str:
         """Validate that id is a valid UUID"""
-        try:
-            UUID(v)
-        except ValueError as e:
-            raise ValueError(f"Invalid UUID format: {v}") from e
+        if not CHUNK_ID_RE.match(v):
+            raise ValueError(f"Invalid UUID format: {v}")
         return v
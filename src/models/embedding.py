@@ -1,29 +1,49 @@
 """Vector embedding data model"""
 
+from array import array
 from datetime import datetime, timezone
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Bytes per float32 component
+_FLOAT32_SIZE = 4
 
 
 class VectorEmbedding(BaseModel):
     """Numerical vector representation of a documentation chunk"""
 
+    # Raw vectors travel as base64 in JSON
+    model_config = ConfigDict(ser_json_bytes="base64", val_json_bytes="base64")
+
     chunk_id: str = Field(description="Foreign key to DocumentationChunk.id")
-    embedding: list[float] = Field(
-        min_length=384,
-        max_length=384,
-        description="Vector representation (384 dimensions for text-embedding-3-small)",
+    embedding: bytes = Field(
+        description="Packed float32 vector (384 dimensions for bge-small-en-v1.5); "
+        "the vector store keeps an int8-quantized copy, not these bytes",
     )
-    model_name: str = Field(description="Embedding model used (e.g., text-embedding-3-small)")
+    model_name: str = Field(description="Embedding model used (e.g., bge-small-en-v1.5)")
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc),
         description="When embedding was generated",
     )
 
+    @field_validator("embedding", mode="before")
+    @classmethod
+    def pack_float_list(cls, v: object) -> object:
+        """Accept a list of floats and pack it to float32 bytes"""
+        if isinstance(v, list | tuple):
+            return array("f", v).tobytes()
+        return v
+
     @field_validator("embedding")
     @classmethod
-    def validate_dimension(cls, v: list[float]) -> list[float]:
+    def validate_dimension(cls, v: bytes) -> bytes:
         """Validate embedding has exactly 384 dimensions"""
-        if len(v) != 384:
-            raise ValueError(f"Embedding must have 384 dimensions, got {len(v)}")
+        if len(v) != 384 * _FLOAT32_SIZE:
+            raise ValueError(f"Embedding must have 384 dimensions, got {len(v) / _FLOAT32_SIZE:g}")
         return v
+
+    def as_array(self) -> array:
+        """Return the embedding as a float32 array without copying into Python floats"""
+        vector = array("f")
+        vector.frombytes(self.embedding)
+        return vector
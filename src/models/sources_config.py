@@ -38,6 +38,12 @@ class FetchingConfig(BaseModel):
     concurrent_limit: int = Field(default=5, ge=1, le=20, description="Max concurrent requests")
     delay_ms: int = Field(default=100, ge=0, le=5000, description="Delay between requests (ms)")
     max_depth: int = Field(default=5, ge=1, le=10, description="Max crawl depth for websites")
+    max_page_age_hours: int = Field(
+        default=12,
+        ge=0,
+        le=720,
+        description="Refetch cached pages older than this in incremental syncs (0 refetches all)",
+    )
 
 
 class GitHubConfig(BaseModel):
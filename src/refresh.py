@@ -28,7 +28,7 @@ def main() -> int:
 
     try:
         logger.info("Starting refresh operation")
-        logger.info(f"Timestamp: {datetime.now().isoformat()}")
+        logger.info("Timestamp: %s", datetime.now().isoformat())
 
         # Initialize and execute
         logger.info("Initializing RefreshOrchestrator")
@@ -42,16 +42,16 @@ def main() -> int:
             logger.error("Refresh returned None unexpectedly")
             return 1
 
-        logger.info(f"Refresh completed successfully in {result.duration_seconds:.2f}s")
+        logger.info("Refresh completed successfully in %.2fs", result.duration_seconds)
         return 0
     except RefreshException as e:
-        logger.error(f"Refresh failed: {e}")
+        logger.error("Refresh failed: %s", e)
         return 1
     except FileNotFoundError as e:
-        logger.error(f"Configuration file not found: {e}")
+        logger.error("Configuration file not found: %s", e)
         return 1
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         return 1
 
 
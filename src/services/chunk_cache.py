@@ -0,0 +1,168 @@
+"""Persistent cache of parsed chunks keyed by source file content hash"""
+
+import hashlib
+import sqlite3
+from importlib import metadata
+from pathlib import Path
+
+import orjson
+
+from src.config import config
+from src.models.chunk import DocumentationChunk
+
+# Modules and libraries whose code decides what chunks a file produces
+_SRC_DIR = Path(__file__).resolve().parent.parent
+_CHUNKING_SOURCES = (
+    "build.py",
+    "models/chunk.py",
+    "models/website_cache.py",
+    "services/chunker.py",
+    "services/doc_parser.py",
+    "services/example_parser.py",
+    "services/html_parser.py",
+)
+_CHUNKING_PACKAGES = ("markdown-it-py", "mdit-py-plugins", "pyyaml", "selectolax", "tiktoken")
+
+
+def _code_version() -> str:
+    """
+    Fingerprint of the parsing and chunking code
+
+    Folded into every cache key, so editing a parser or the chunker, or
+    upgrading one of the libraries they use, retires earlier entries.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for name in _CHUNKING_SOURCES:
+        digest.update((_SRC_DIR / name).read_bytes())
+    for package in _CHUNKING_PACKAGES:
+        try:
+            digest.update(f"{package}=={metadata.version(package)}".encode())
+        except metadata.PackageNotFoundError:
+            digest.update(f"{package}==".encode())
+    return digest.hexdigest()
+
+
+_CODE_VERSION = _code_version()
+
+# Keep IN (...) lists well below SQLite's bound-parameter limit
+_LOOKUP_BATCH_SIZE = 500
+
+# Per-build fields; cached chunks get fresh values when loaded
+_VOLATILE_FIELDS = {"id", "created_at"}
+
+
+class ChunkCache:
+    """SQLite-backed cache of chunks, so unchanged files are not re-parsed"""
+
+    def __init__(self, db_path: str | None = None):
+        """
+        Initialize chunk cache
+
+        Args:
+            db_path: Cache database path (default from config)
+        """
+        self.db_path = db_path or config.chunk_cache_path
+
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS chunk_cache (
+                key BLOB PRIMARY KEY,
+                chunks BLOB NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+        # Keys looked up or stored by this build, kept when the cache is pruned
+        self._used_keys: set[bytes] = set()
+
+    @staticmethod
+    def file_key(content: bytes, source_url: str, kind: str) -> bytes:
+        """Hash a file's content and everything else that shapes its chunks"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(
+            orjson.dumps(
+                [
+                    _CODE_VERSION,
+                    kind,
+                    source_url,
+                    config.chunk_size_tokens,
+                    config.chunk_overlap_tokens,
+                    config.min_chunk_size_tokens,
+                ]
+            )
+        )
+        digest.update(content)
+        return digest.digest()
+
+    def get_many(self, keys: list[bytes]) -> dict[bytes, list[DocumentationChunk]]:
+        """
+        Look up cached chunks
+
+        Args:
+            keys: Cache keys from file_key()
+
+        Returns:
+            dict: Mapping of key to newly identified chunks for every key found
+        """
+        found: dict[bytes, list[DocumentationChunk]] = {}
+        unique_keys = list(dict.fromkeys(keys))
+        self._used_keys.update(unique_keys)
+
+        for start in range(0, len(unique_keys), _LOOKUP_BATCH_SIZE):
+            batch = unique_keys[start : start + _LOOKUP_BATCH_SIZE]
+            placeholders = ", ".join("?" * len(batch))
+            cursor = self.conn.execute(
+                f"SELECT key, chunks FROM chunk_cache WHERE key IN ({placeholders})", batch
+            )
+            for key, chunks in cursor:
+                found[key] = [DocumentationChunk(**data) for data in orjson.loads(chunks)]
+
+        return found
+
+    def put_many(self, items: list[tuple[bytes, list[DocumentationChunk]]]) -> None:
+        """
+        Store chunks in the cache
+
+        Args:
+            items: List of (key, chunks) tuples
+        """
+        self._used_keys.update(key for key, _ in items)
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO chunk_cache (key, chunks) VALUES (?, ?)",
+            [
+                (
+                    key,
+                    orjson.dumps([chunk.model_dump(exclude=_VOLATILE_FIELDS) for chunk in chunks]),
+                )
+                for key, chunks in items
+            ],
+        )
+        self.conn.commit()
+
+    def prune(self) -> int:
+        """
+        Delete entries this build neither looked up nor stored
+
+        Call once every source has been parsed, so files that were removed or
+        changed, and entries from older code, do not pile up across builds.
+
+        Returns:
+            int: Number of entries deleted
+        """
+        self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS used_keys (key BLOB PRIMARY KEY)")
+        self.conn.execute("DELETE FROM used_keys")
+        self.conn.executemany(
+            "INSERT INTO used_keys (key) VALUES (?)", [(key,) for key in self._used_keys]
+        )
+        cursor = self.conn.execute(
+            "DELETE FROM chunk_cache WHERE key NOT IN (SELECT key FROM used_keys)"
+        )
+        self.conn.commit()
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the cache database connection"""
+        self.conn.close()
@@ -1,11 +1,26 @@
 """Content chunking service with semantic awareness"""
 
+from functools import lru_cache
+
 import tiktoken
 
 from src.config import config
 from src.models.chunk import DocumentationChunk
 from src.services.doc_parser import ParsedContent
 
+# Threads tiktoken may use per batch; builds already run one chunking process per CPU
+_ENCODE_THREADS = 2
+
+
+@lru_cache(maxsize=4)
+def _get_encoder(model_name: str) -> tiktoken.Encoding:
+    """Load the tiktoken encoder for a model once per process"""
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        # Fallback to cl100k_base (used by gpt-3.5 and gpt-4)
+        return tiktoken.get_encoding("cl100k_base")
+
 
 class Chunker:
     """Chunk documentation content with token counting and structure awareness"""
@@ -15,12 +30,8 @@ class Chunker:
         self.chunk_overlap_tokens = config.chunk_overlap_tokens
         self.min_chunk_size_tokens = config.min_chunk_size_tokens
 
-        # Initialize tiktoken encoder for OpenAI models
-        try:
-            self.encoder = tiktoken.encoding_for_model(config.embedding_model)
-        except KeyError:
-            # Fallback to cl100k_base (used by gpt-3.5 and gpt-4)
-            self.encoder = tiktoken.get_encoding("cl100k_base")
+        # Shared tiktoken encoder, so creating a Chunker per file stays cheap
+        self.encoder = _get_encoder(config.embedding_model)
 
     async def chunk(
         self, parsed_content: ParsedContent, source_file: str
@@ -72,11 +83,20 @@ class Chunker:
         chunks = []
         aggregated_content = []
         aggregated_headings = []
+        aggregated_tokens = []
         current_tokens = 0
 
+        # Count every section's tokens in one batch instead of one encode call per section
+        section_token_counts = [
+            len(tokens)
+            for tokens in self.encoder.encode_ordinary_batch(
+                [content for _, content in sections], num_threads=_ENCODE_THREADS
+            )
+        ]
+
         for i, (heading, content) in enumerate(sections):
             section_text = f"{content}"  # Content already includes heading
-            section_tokens = self.count_tokens(section_text)
+            section_tokens = section_token_counts[i]
             is_last_section = i == len(sections) - 1
 
             # Check if adding this section would exceed max size
@@ -94,23 +114,26 @@ class Chunker:
                         # Within 20% over limit, include it to avoid undersized chunks
                         aggregated_content.append(section_text)
                         aggregated_headings.append(heading)
+                        aggregated_tokens.append(section_tokens)
                         current_tokens += section_tokens
                         continue
 
                 # Create chunk from accumulated content
                 chunks.extend(
                     await self._create_aggregated_chunk(
-                        aggregated_content, aggregated_headings, source_file
+                        aggregated_content, aggregated_headings, source_file, aggregated_tokens
                     )
                 )
                 # Start new aggregation with current section
                 aggregated_content = [section_text]
                 aggregated_headings = [heading]
+                aggregated_tokens = [section_tokens]
                 current_tokens = section_tokens
             else:
                 # Add to current aggregation
                 aggregated_content.append(section_text)
                 aggregated_headings.append(heading)
+                aggregated_tokens.append(section_tokens)
                 current_tokens += section_tokens
 
         # Create final chunk from remaining content
@@ -138,21 +161,25 @@ class Chunker:
                     # Can't merge, create separate small chunk
                     chunks.extend(
                         await self._create_aggregated_chunk(
-                            aggregated_content, aggregated_headings, source_file
+                            aggregated_content, aggregated_headings, source_file, aggregated_tokens
                         )
                     )
             else:
                 # Normal case - create final chunk
                 chunks.extend(
                     await self._create_aggregated_chunk(
-                        aggregated_content, aggregated_headings, source_file
+                        aggregated_content, aggregated_headings, source_file, aggregated_tokens
                     )
                 )
 
         return chunks
 
     async def _create_aggregated_chunk(
-        self, content_parts: list[str], headings: list[str], source_file: str
+        self,
+        content_parts: list[str],
+        headings: list[str],
+        source_file: str,
+        part_tokens: list[int] | None = None,
     ) -> list[DocumentationChunk]:
         """
         Create chunk(s) from aggregated content, splitting if necessary
@@ -161,13 +188,22 @@ class Chunker:
             content_parts: List of content strings to combine
             headings: List of section headings
             source_file: Path to source file
+            part_tokens: Token counts already known for each content part
 
         Returns:
             list[DocumentationChunk]: One or more chunks
         """
         # Combine all content with double newlines for readability
         combined_content = "\n\n".join(content_parts)
-        combined_tokens = self.count_tokens(combined_content)
+
+        # A single part's count is already known; joined parts are encoded once, and the
+        # tokens are reused if the content has to be split
+        tokens = None
+        if part_tokens is not None and len(part_tokens) == 1:
+            combined_tokens = part_tokens[0]
+        else:
+            tokens = self.encoder.encode(combined_content)
+            combined_tokens = len(tokens)
 
         # Create section heading (combine multiple headings if aggregated)
         if len(headings) == 1:
@@ -189,18 +225,23 @@ class Chunker:
             ]
 
         # Content too large, split it with overlap
-        return await self._chunk_section(combined_content, section_heading, source_file)
+        return await self._chunk_section(combined_content, section_heading, source_file, tokens)
 
     async def _chunk_section(
-        self, content: str, section_heading: str | None, source_file: str
+        self,
+        content: str,
+        section_heading: str | None,
+        source_file: str,
+        tokens: list[int] | None = None,
     ) -> list[DocumentationChunk]:
         """
         Chunk a single section of content
 
         Respects token limits and creates overlapping chunks for context.
         """
-        # Count tokens in content
-        tokens = self.encoder.encode(content)
+        # Count tokens in content unless the caller already encoded it
+        if tokens is None:
+            tokens = self.encoder.encode(content)
         total_tokens = len(tokens)
 
         # If section is small enough, return as single chunk
@@ -262,13 +303,18 @@ class Chunker:
         Respects paragraph boundaries instead of arbitrary token cutoffs.
         """
         paragraphs = content.split("\n\n")
+        para_token_counts = [
+            len(tokens)
+            for tokens in self.encoder.encode_ordinary_batch(
+                paragraphs, num_threads=_ENCODE_THREADS
+            )
+        ]
         chunks = []
         current_chunk_text = []
         current_token_count = 0
+        last_para_tokens = 0
 
-        for para in paragraphs:
-            para_tokens = self.count_tokens(para)
-
+        for para, para_tokens in zip(paragraphs, para_token_counts, strict=True):
             # If adding this paragraph exceeds limit, finalize current chunk
             if current_token_count + para_tokens > self.chunk_size_tokens and current_chunk_text:
                 chunk_text = "\n\n".join(current_chunk_text)
@@ -282,14 +328,13 @@ class Chunker:
                     )
                 )
                 # Start new chunk with overlap (include last paragraph)
-                current_chunk_text = [current_chunk_text[-1]] if current_chunk_text else []
-                current_token_count = (
-                    self.count_tokens(current_chunk_text[0]) if current_chunk_text else 0
-                )
+                current_chunk_text = [current_chunk_text[-1]]
+                current_token_count = last_para_tokens
 
             # Add paragraph to current chunk
             current_chunk_text.append(para)
             current_token_count += para_tokens
+            last_para_tokens = para_tokens
 
         # Add final chunk
         if current_chunk_text:
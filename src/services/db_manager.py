@@ -1,10 +1,12 @@
 """Database manager for atomic database swapping during refreshes"""
 
+import fnmatch
 import logging
 import os
 import sqlite3
 import threading
-from datetime import datetime
+import time
+from contextlib import closing
 from pathlib import Path
 
 from src.config import config
@@ -12,6 +14,19 @@ from src.config import config
 logger = logging.getLogger(__name__)
 
 
+def _backup_sequence(backup_name: str) -> int:
+    """
+    Sort key for a backup file name, larger is newer
+
+    Backups are suffixed with time.time_ns(). Older releases used a
+    %Y%m%d-%H%M%S suffix, which still orders correctly with the dash removed
+    and is always smaller than a nanosecond timestamp. Unrecognized suffixes
+    sort as oldest.
+    """
+    suffix = backup_name.rsplit(".backup-", 1)[-1].replace("-", "")
+    return int(suffix) if suffix.isdigit() else -1
+
+
 class IntegrityCheckError(Exception):
     """Raised when database integrity check fails"""
 
@@ -36,11 +51,20 @@ class DatabaseManager:
             logger.error(error_msg)
             raise IntegrityCheckError(error_msg)
 
-        with sqlite3.connect(db_path) as conn:
+        # Read-only autocommit connection: the probe never writes, so skip transaction setup
+        conn = sqlite3.connect(
+            f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True, isolation_level=None
+        )
+        with closing(conn):
             cursor = conn.cursor()
 
-            # Run PRAGMA integrity_check
-            cursor.execute("PRAGMA integrity_check")
+            # Read pages through mmap and a larger page cache while scanning
+            cursor.execute("PRAGMA mmap_size=268435456")
+            cursor.execute("PRAGMA cache_size=-65536")
+
+            # quick_check catches corrupt pages without the full index cross-checks
+            check = "integrity_check" if self.config.db_full_integrity_check else "quick_check"
+            cursor.execute(f"PRAGMA {check}")
             result = cursor.fetchone()
 
             if result and result[0] == "ok":
@@ -94,22 +118,22 @@ class DatabaseManager:
             # Step 1: Verify temp database (will raise if invalid)
             self._check_db_integrity(temp_path)
 
-            # Step 2: Create backup
-            backup_path = f"{active_path}.backup-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+            # Step 2: Create backup (nanosecond suffix so back-to-back swaps never collide)
+            backup_path = f"{active_path}.backup-{time.time_ns()}"
 
             try:
                 # Check if active database exists
                 if os.path.exists(active_path):
                     logger.info(f"Creating backup: {active_path} -> {backup_path}")
-                    # Use rename for atomic operation
-                    os.rename(active_path, backup_path)
+                    # Use replace for an atomic rename that also overwrites on Windows
+                    os.replace(active_path, backup_path)
                 else:
                     logger.warning(f"Active database does not exist: {active_path}")
                     backup_path = None
 
                 # Step 3: Atomic rename (this is atomic on Unix and Windows)
                 logger.info(f"Swapping databases: {temp_path} -> {active_path}")
-                os.rename(temp_path, active_path)
+                os.replace(temp_path, active_path)
 
                 logger.info("Database swap completed successfully")
 
@@ -124,9 +148,7 @@ class DatabaseManager:
                 if backup_path and os.path.exists(backup_path):
                     try:
                         logger.info("Rolling back to backup database")
-                        if os.path.exists(active_path):
-                            os.remove(active_path)
-                        os.rename(backup_path, active_path)
+                        os.replace(backup_path, active_path)
                         logger.info("Rollback completed")
                     except Exception as rollback_error:
                         logger.error(f"Rollback failed: {rollback_error}")
@@ -157,18 +179,18 @@ class DatabaseManager:
             db_dir = Path(db_path).parent
             db_name = Path(db_path).name
 
-            # Find all backup files
+            # Find all backup files and order them newest first by their name suffix
             backup_pattern = f"{db_name}.backup-*"
-            backups = sorted(
-                db_dir.glob(backup_pattern),
-                key=lambda p: os.path.getmtime(p),
-                reverse=True,
-            )
+            with os.scandir(db_dir) as entries:
+                backups = [
+                    entry for entry in entries if fnmatch.fnmatchcase(entry.name, backup_pattern)
+                ]
+            backups.sort(key=lambda entry: _backup_sequence(entry.name), reverse=True)
 
             # Remove old backups (keep only keep_count most recent)
             for backup in backups[keep_count:]:
-                logger.info(f"Removing old backup: {backup}")
-                backup.unlink()
+                logger.info(f"Removing old backup: {backup.path}")
+                os.remove(backup.path)
 
         except Exception as e:
             logger.error(f"Error cleaning up old backups: {e}")
@@ -2,6 +2,7 @@
 
 import json
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -20,14 +21,58 @@ class ParsedContent:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+@lru_cache(maxsize=1)
+def _get_markdown_parser() -> MarkdownIt:
+    """Build the configured markdown-it parser once per process"""
+    md = MarkdownIt("commonmark", {"breaks": True, "html": True})
+    md.use(front_matter_plugin)
+    md.enable("table")
+    return md
+
+
+def _top_level_keys(data: Any) -> str | None:
+    """Comma-separated top-level keys of a parsed mapping, if any"""
+    if isinstance(data, dict) and data:
+        return ", ".join(str(k) for k in data)
+    return None
+
+
+# Code blocks repeat across pages (install snippets, sample configs), so each distinct
+# block is loaded and re-serialized once per process. Only strings are cached, never
+# the mutable parsed data.
+@lru_cache(maxsize=1024)
+def _load_yaml_block(content: str) -> tuple[str, str | None] | None:
+    """Return (formatted YAML, top-level keys) for a YAML block, or None if empty/invalid"""
+    try:
+        data = yaml.safe_load(content)
+        if data is None:
+            return None
+
+        # Format YAML nicely
+        formatted_yaml = yaml.dump(data, default_flow_style=False, sort_keys=False)
+    except yaml.YAMLError:
+        return None
+    return formatted_yaml, _top_level_keys(data)
+
+
+@lru_cache(maxsize=1024)
+def _load_json_block(content: str) -> tuple[str, str | None] | None:
+    """Return (formatted JSON, top-level keys) for a JSON block, or None if invalid"""
+    try:
+        data = json.loads(content)
+    except json.JSONDecodeError:
+        return None
+
+    # Format JSON nicely
+    return json.dumps(data, indent=2, sort_keys=False), _top_level_keys(data)
+
+
 class DocParser:
     """Parse markdown documentation and extract structured content"""
 
     def __init__(self):
-        # Initialize markdown-it parser with plugins
-        self.md = MarkdownIt("commonmark", {"breaks": True, "html": True})
-        self.md.use(front_matter_plugin)
-        self.md.enable("table")
+        # Shared markdown-it parser; parse() keeps no state on it between calls
+        self.md = _get_markdown_parser()
 
     async def parse(self, file_path: Path | str) -> ParsedContent:
         """
@@ -69,12 +114,14 @@ class DocParser:
         is_first_heading = True
 
         for token in tokens:
-            if token.type == "heading_open":
+            # Read each token's type once; most tokens match none of the branches
+            token_type = token.type
+            if token_type == "heading_open":
                 # Save previous section before starting new one
                 self._save_current_section(sections, current_heading, current_section_content)
                 current_section_content = []
                 current_heading = None
-            elif token.type == "inline" and token.content:
+            elif token_type == "inline" and token.content:
                 text_parts.append(token.content)
 
                 # Check if this is heading content (previous token was heading_open)
@@ -89,7 +136,7 @@ class DocParser:
                 else:
                     # This is regular content under the current heading
                     current_section_content.append(token.content)
-            elif token.type in ("code_block", "fence") and token.content:
+            elif token_type in ("code_block", "fence") and token.content:
                 self._process_code_block(
                     token, current_heading, text_parts, current_section_content
                 )
@@ -140,57 +187,45 @@ class DocParser:
 
     def _parse_yaml_code_block(self, content: str, context_heading: str | None) -> str | None:
         """Parse YAML code block and return enhanced text representation"""
-        try:
-            data = yaml.safe_load(content)
-            if data is None:
-                return None
-
-            # Format YAML nicely
-            formatted_yaml = yaml.dump(data, default_flow_style=False, sort_keys=False)
-
-            # Create enhanced representation
-            parts = ["YAML code block"]
-            if context_heading:
-                parts.append(f"Context: {context_heading}")
-            parts.append(f"Content:\n{content}")
-
-            # Add structured representation if different
-            if formatted_yaml != content:
-                parts.append(f"Structured format:\n{formatted_yaml}")
-
-            # Add top-level keys if it's a dict
-            if isinstance(data, dict):
-                keys = list(data.keys())
-                if keys:
-                    parts.append(f"Top-level keys: {', '.join(str(k) for k in keys)}")
-
-            return "\n\n".join(parts)
-        except yaml.YAMLError:
+        loaded = _load_yaml_block(content)
+        if loaded is None:
             return None
+        formatted_yaml, keys = loaded
+
+        # Create enhanced representation
+        parts = ["YAML code block"]
+        if context_heading:
+            parts.append(f"Context: {context_heading}")
+        parts.append(f"Content:\n{content}")
+
+        # Add structured representation if different
+        if formatted_yaml != content:
+            parts.append(f"Structured format:\n{formatted_yaml}")
+
+        # Add top-level keys if it's a dict
+        if keys:
+            parts.append(f"Top-level keys: {keys}")
+
+        return "\n\n".join(parts)
 
     def _parse_json_code_block(self, content: str, context_heading: str | None) -> str | None:
         """Parse JSON code block and return enhanced text representation"""
-        try:
-            data = json.loads(content)
-
-            # Format JSON nicely
-            formatted_json = json.dumps(data, indent=2, sort_keys=False)
-
-            # Create enhanced representation
-            parts = ["JSON code block"]
-            if context_heading:
-                parts.append(f"Context: {context_heading}")
-            parts.append(f"Content:\n{formatted_json}")
-
-            # Add top-level keys if it's a dict
-            if isinstance(data, dict):
-                keys = list(data.keys())
-                if keys:
-                    parts.append(f"Top-level keys: {', '.join(str(k) for k in keys)}")
-
-            return "\n\n".join(parts)
-        except json.JSONDecodeError:
+        loaded = _load_json_block(content)
+        if loaded is None:
             return None
+        formatted_json, keys = loaded
+
+        # Create enhanced representation
+        parts = ["JSON code block"]
+        if context_heading:
+            parts.append(f"Context: {context_heading}")
+        parts.append(f"Content:\n{formatted_json}")
+
+        # Add top-level keys if it's a dict
+        if keys:
+            parts.append(f"Top-level keys: {keys}")
+
+        return "\n\n".join(parts)
 
     def _save_current_section(
         self, sections: list, heading: str | None, content: list[str]
@@ -205,11 +240,12 @@ class DocParser:
         in_heading = False
 
         for token in tokens:
-            if token.type == "heading_open":
+            token_type = token.type
+            if token_type == "heading_open":
                 in_heading = True
-            elif token.type == "heading_close":
+            elif token_type == "heading_close":
                 in_heading = False
-            elif in_heading and token.type == "inline":
+            elif in_heading and token_type == "inline":
                 headings.append(token.content)
 
         return headings
@@ -1,9 +1,10 @@
 """Documentation synchronization service - Website-based"""
 
+import asyncio
 import hashlib
-import json
 import logging
-from datetime import datetime
+import shutil
+from datetime import datetime, timedelta
 from pathlib import Path
 
 from pydantic import HttpUrl
@@ -50,7 +51,7 @@ class DocSync:
             path_prefix: Path prefix to limit crawling
             fetching_config: Fetching configuration (optional, uses defaults if None)
             chunker: Chunker service (optional, creates new if None)
-            embedder: Embedder service (optional, creates new if None)
+            embedder: Embedder service (optional, creates new if None and vector_store is set)
             vector_store: VectorStore service (optional, creates new if None)
         """
         self.base_url = base_url
@@ -59,7 +60,8 @@ class DocSync:
         self.fetcher = WebsiteFetcher(base_url, path_prefix, self.fetching_config)
         self.html_parser = HtmlParser()
         self.chunker = chunker or Chunker()
-        self.embedder = embedder or Embedder()
+        # Only needed when storing embeddings; avoids loading the model for fetch-only syncs
+        self.embedder = embedder or (Embedder() if vector_store else None)
         self.vector_store = vector_store
         self._cache_dir = Path(config.docs_website_cache_path)
 
@@ -116,13 +118,20 @@ class DocSync:
                 cache_metadata, force_refresh, incremental
             )
 
+            # First sync for this site: start from empty metadata
+            if cache_metadata is None:
+                cache_metadata = CacheMetadata(
+                    base_url=str(self.base_url),
+                    last_full_sync=start_time,
+                    total_pages=0,
+                )
+
             # Fetch and process pages
             (
                 pages_updated,
                 pages_failed,
                 failed_urls,
                 total_bytes,
-                cache_metadata,
             ) = await self._fetch_and_process_pages(urls_to_fetch, cache_metadata)
 
             # Update cache metadata and stats
@@ -162,10 +171,17 @@ class DocSync:
             urls_to_fetch = list(discovered_urls)
             logger.info("Force refresh: fetching all pages")
         elif incremental and cache_metadata:
-            # Only fetch new or potentially changed pages
-            urls_to_fetch = [url for url in discovered_urls if url not in cache_metadata.pages]
+            # Only fetch new pages and cached pages old enough to have changed; pages are
+            # keyed by URL string, and an HttpUrl never equals (or hashes like) its string form
+            cached_pages = cache_metadata.pages
+            stale_before = datetime.now() - timedelta(hours=self.fetching_config.max_page_age_hours)
+            urls_to_fetch = []
+            for url in discovered_urls:
+                cached_page = cached_pages.get(str(url))
+                if cached_page is None or cached_page.fetch_timestamp <= stale_before:
+                    urls_to_fetch.append(url)
             logger.info(
-                f"Incremental sync: {len(urls_to_fetch)} new pages, "
+                f"Incremental sync: {len(urls_to_fetch)} new or stale pages, "
                 f"{len(discovered_urls) - len(urls_to_fetch)} cached"
             )
         else:
@@ -175,46 +191,51 @@ class DocSync:
         return list(discovered_urls), urls_to_fetch
 
     async def _fetch_and_process_pages(
-        self, urls_to_fetch: list[HttpUrl], cache_metadata: CacheMetadata | None
-    ) -> tuple[int, int, list[str], int, CacheMetadata]:
+        self, urls_to_fetch: list[HttpUrl], cache_metadata: CacheMetadata
+    ) -> tuple[int, int, list[str], int]:
         """Fetch pages and process them into cache and vector store"""
         fetch_results = await self.fetcher.fetch_multiple(
             urls_to_fetch, use_cache=False, fail_fast=False
         )
+        # Every page in the batch was fetched by now; stamp them all with one time
+        fetched_at = datetime.now()
 
         pages_updated = 0
         pages_failed = 0
         failed_urls = []
         total_bytes = 0
 
-        if cache_metadata is None:
-            cache_metadata = CacheMetadata(
-                base_url=str(self.base_url),
-                last_full_sync=datetime.now(),
-                total_pages=0,
-            )
-
         for result in fetch_results:
             if result.success and result.content:
-                await self._process_successful_fetch(result, cache_metadata)
+                total_bytes += await self._process_successful_fetch(
+                    result, cache_metadata, fetched_at
+                )
                 pages_updated += 1
-                total_bytes += len(result.content)
                 logger.info(f"✓ Fetched and cached: {result.url}")
             else:
                 pages_failed += 1
                 failed_urls.append(str(result.url))
                 logger.warning(f"✗ Failed to fetch {result.url}: {result.error_message}")
 
-        return pages_updated, pages_failed, failed_urls, total_bytes, cache_metadata
+        return pages_updated, pages_failed, failed_urls, total_bytes
+
+    async def _process_successful_fetch(
+        self, result, cache_metadata: CacheMetadata, fetched_at: datetime
+    ) -> int:
+        """
+        Process a successfully fetched page
 
-    async def _process_successful_fetch(self, result, cache_metadata: CacheMetadata) -> None:
-        """Process a successfully fetched page"""
-        # Save HTML to cache
+        Returns:
+            int: Size of the cached HTML file in bytes
+        """
+        # Save HTML to cache; sizes are recorded from the UTF-8 bytes actually written
         url_hash = hashlib.sha256(str(result.url).encode()).hexdigest()
-        content_hash = hashlib.sha256(result.content.encode()).hexdigest()
+        content_bytes = result.content.encode("utf-8")
+        content_hash = hashlib.sha256(content_bytes).hexdigest()
 
         html_file = self.pages_dir / f"{url_hash}.html"
-        html_file.write_text(result.content, encoding="utf-8")
+        # Write on a worker thread so sources syncing concurrently keep fetching
+        await asyncio.to_thread(html_file.write_bytes, content_bytes)
 
         # Parse and process content
         parsed_html = None
@@ -229,9 +250,9 @@ class DocSync:
         cached_page = CachedPage(
             url=result.url,
             url_hash=url_hash,
-            fetch_timestamp=datetime.now(),
+            fetch_timestamp=fetched_at,
             content_hash=content_hash,
-            content_length=len(result.content),
+            content_length=len(content_bytes),
             http_status=result.status,
             etag=result.etag,
             last_modified=result.last_modified,
@@ -239,9 +260,15 @@ class DocSync:
             extracted_at=datetime.now() if parsed_html else None,
         )
         cache_metadata.pages[str(result.url)] = cached_page
+        return len(content_bytes)
 
     async def _process_parsed_content(self, parsed_html: ParsedContent, url: str) -> None:
         """Process parsed HTML content through chunker and embedder"""
+        # Without a vector store the chunks would be discarded; the build re-chunks
+        # cached pages in its own worker pool
+        if not self.vector_store or not self.embedder:
+            return
+
         # Convert to format expected by chunker
         markdown_parsed = self._convert_to_markdown_format(parsed_html)
 
@@ -249,23 +276,21 @@ class DocSync:
         chunks = await self.chunker.chunk(markdown_parsed, url)
         logger.debug(f"Created {len(chunks)} chunks from {url}")
 
-        # Generate embeddings and store if vector_store is available
-        if self.vector_store and chunks:
+        if chunks:
             # Generate embeddings for all chunks
             chunk_texts = [chunk.content for chunk in chunks]
             embeddings = await self.embedder.embed_batch(
                 chunk_texts, batch_size=config.embedding_batch_size
             )
 
-            # Store chunks and embeddings in vector store
-            for chunk, embedding in zip(chunks, embeddings, strict=True):
-                await self.vector_store.insert_chunk(chunk, embedding)
+            # Store the page's chunks and embeddings in one transaction
+            await self.vector_store.insert_chunks_batch(chunks, embeddings)
 
             logger.debug(f"Stored {len(chunks)} chunks and embeddings for {url}")
 
     def _update_cache_metadata(
         self,
-        cache_metadata: CacheMetadata | None,
+        cache_metadata: CacheMetadata,
         start_time: datetime,
         discovered_urls: list[HttpUrl],
         urls_to_fetch: list[HttpUrl],
@@ -275,13 +300,6 @@ class DocSync:
         total_bytes: int,
     ) -> CacheMetadata:
         """Update cache metadata with sync results"""
-        if cache_metadata is None:
-            cache_metadata = CacheMetadata(
-                base_url=str(self.base_url),
-                last_full_sync=start_time,
-                total_pages=0,
-            )
-
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
 
@@ -325,10 +343,8 @@ class DocSync:
         if not cache_metadata:
             return {}
 
-        # Calculate cache size
-        cache_size_bytes = sum(
-            f.stat().st_size for f in self.pages_dir.glob("*.html") if f.is_file()
-        )
+        # Calculate cache size from recorded page sizes rather than stat-ing every page file
+        cache_size_bytes = sum(page.content_length for page in cache_metadata.pages.values())
         cache_size_mb = cache_size_bytes / (1024 * 1024)
 
         return {
@@ -348,9 +364,9 @@ class DocSync:
         Deletes all cached HTML files and metadata
         """
         if self.cache_dir.exists():
-            # Delete all HTML files
-            for html_file in self.pages_dir.glob("*.html"):
-                html_file.unlink()
+            # Delete all HTML files; sync_docs recreates the directory
+            if self.pages_dir.exists():
+                shutil.rmtree(self.pages_dir)
 
             # Delete metadata
             if self.metadata_file.exists():
@@ -381,8 +397,8 @@ class DocSync:
             return None
 
         try:
-            data = json.loads(self.metadata_file.read_text(encoding="utf-8"))
-            return CacheMetadata(**data)
+            # Parse and validate in one pass inside pydantic-core
+            return CacheMetadata.model_validate_json(self.metadata_file.read_bytes())
         except Exception as e:
             logger.error(f"Failed to load cache metadata: {e}")
             return None
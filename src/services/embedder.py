@@ -1,9 +1,33 @@
 """Embedding generation service using local models via fastembed"""
 
+import logging
+
+import onnxruntime
 from fastembed import TextEmbedding
 
 from src.config import config
 
+logger = logging.getLogger(__name__)
+
+
+def _available_providers(requested: list[str]) -> list[str] | None:
+    """
+    Filter configured execution providers down to those onnxruntime can use
+
+    Returns None (fastembed's CPU default) when nothing usable was requested,
+    e.g. CUDAExecutionProvider without onnxruntime-gpu installed.
+    """
+    if not requested:
+        return None
+
+    available = set(onnxruntime.get_available_providers())
+    providers = [provider for provider in requested if provider in available]
+    missing = [provider for provider in requested if provider not in available]
+    if missing:
+        logger.warning("Execution providers not available, skipping: %s", ", ".join(missing))
+
+    return providers or None
+
 
 class Embedder:
     """Generate embeddings using local models (fastembed) with caching"""
@@ -11,7 +35,11 @@ class Embedder:
     def __init__(self):
         """Initialize embedding model with local caching"""
         # Initialize fastembed with local caching
-        self.model = TextEmbedding(model_name=config.embedding_model, threads=6)
+        self.model = TextEmbedding(
+            model_name=config.embedding_model,
+            threads=config.embedding_threads,
+            providers=_available_providers(config.embedding_providers),
+        )
 
     async def embed_text(self, text: str) -> list[float]:
         """
@@ -45,20 +73,18 @@ class Embedder:
 
         batch_size = batch_size or config.embedding_batch_size
 
-        # Process in batches for memory efficiency
-        embeddings: list[list[float]] = []
-
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-
-            # fastembed processes batches efficiently
-            batch_embeddings = list(self.model.embed(batch))
+        # Batch texts of similar length together so each batch is padded to a
+        # short max sequence length; character count is a cheap token proxy
+        order = sorted(range(len(texts)), key=lambda idx: len(texts[idx]))
 
-            # Convert numpy arrays to lists
-            embeddings.extend([emb.tolist() for emb in batch_embeddings])
+        # One embed call over the sorted texts; fastembed slices it into batches
+        # itself, so consecutive batches still hold similar lengths
+        embeddings: list[list[float]] = [[] for _ in texts]
+        sorted_embeddings = self.model.embed([texts[idx] for idx in order], batch_size=batch_size)
 
-            if i % 100 == 0 or i == len(texts):
-                print(f"  Embedded {i}/{len(texts)} texts")
+        # Convert numpy arrays to lists, restoring the caller's order
+        for idx, emb in zip(order, sorted_embeddings, strict=True):
+            embeddings[idx] = emb.tolist()
 
         return embeddings
 
@@ -67,14 +93,15 @@ class Embedder:
         # fastembed doesn't require explicit cleanup
         pass
 
-    def download_model(self) -> None:
+    def warm_up(self) -> None:
         """
-        Pre-download model to cache directory
+        Run one embedding so the model is loaded and ready before real work
 
-        Call this during build to ensure model is cached locally.
-        Subsequent runs will use the cached model without re-downloading.
+        __init__ already downloads the model into the cache directory, so this
+        only exercises the loaded ONNX session once, surfacing a broken model
+        at build start rather than at the first batch.
         """
-        # This method is provided for explicit pre-download calls
-        print("Downloading embedding model...")
-        _ = TextEmbedding(model_name=config.embedding_model)
-        print(f"Model {config.embedding_model} cached in {config.fastembed_cache_dir}")
+        list(self.model.embed(["warm up"]))
+        logger.info(
+            "Model %s ready, cached in %s", config.embedding_model, config.fastembed_cache_dir
+        )
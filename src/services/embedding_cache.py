@@ -0,0 +1,91 @@
+"""Persistent embedding cache keyed by chunk content hash"""
+
+import hashlib
+import sqlite3
+import struct
+from pathlib import Path
+
+from src.config import config
+
+# Keep IN (...) lists well below SQLite's bound-parameter limit
+_LOOKUP_BATCH_SIZE = 500
+
+
+class EmbeddingCache:
+    """SQLite-backed cache of embeddings, so unchanged chunks are not re-embedded"""
+
+    def __init__(self, db_path: str | None = None, model_name: str | None = None):
+        """
+        Initialize embedding cache
+
+        Args:
+            db_path: Cache database path (default from config)
+            model_name: Embedding model the cached vectors belong to (default from config)
+        """
+        self.db_path = db_path or config.embedding_cache_path
+        self.model_name = model_name or config.embedding_model
+        self.dimension = config.embedding_dimension
+
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS embed_cache (
+                key BLOB NOT NULL,
+                model TEXT NOT NULL,
+                vec BLOB NOT NULL,
+                PRIMARY KEY (key, model)
+            )
+        """)
+        self.conn.commit()
+
+    @staticmethod
+    def content_key(text: str) -> bytes:
+        """Hash chunk text into a cache key"""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def get_many(self, keys: list[bytes]) -> dict[bytes, list[float]]:
+        """
+        Look up cached embeddings
+
+        Args:
+            keys: Cache keys from content_key()
+
+        Returns:
+            dict: Mapping of key to embedding for every key found in the cache
+        """
+        found: dict[bytes, list[float]] = {}
+        unique_keys = list(dict.fromkeys(keys))
+
+        for start in range(0, len(unique_keys), _LOOKUP_BATCH_SIZE):
+            batch = unique_keys[start : start + _LOOKUP_BATCH_SIZE]
+            placeholders = ", ".join("?" * len(batch))
+            cursor = self.conn.execute(
+                f"SELECT key, vec FROM embed_cache WHERE model = ? AND key IN ({placeholders})",
+                (self.model_name, *batch),
+            )
+            for key, vec in cursor:
+                found[key] = list(struct.unpack(f"{self.dimension}f", vec))
+
+        return found
+
+    def put_many(self, items: list[tuple[bytes, list[float]]]) -> None:
+        """
+        Store embeddings in the cache
+
+        Args:
+            items: List of (key, embedding) tuples
+        """
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO embed_cache (key, model, vec) VALUES (?, ?, ?)",
+            [
+                (key, self.model_name, struct.pack(f"{self.dimension}f", *embedding))
+                for key, embedding in items
+            ],
+        )
+        self.conn.commit()
+
+    def close(self) -> None:
+        """Close the cache database connection"""
+        self.conn.close()
@@ -1,12 +1,64 @@
 """Parser for YAML and JSON example files"""
 
 import json
+import re
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
+import orjson
 import yaml
 
 from src.services.doc_parser import ParsedContent
 
+# Use the libyaml-backed loader and dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+# orjson reads integers wider than 64 bits as floats; such documents go to the stdlib
+_LONG_DIGITS_RE = re.compile(r"\d{19,}")
+
+
+def _dumps_orjson(value: Any) -> str:
+    """Serialize JSON with two-space indentation using orjson"""
+    return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()
+
+
+def _dumps_stdlib(value: Any) -> str:
+    """Serialize JSON with two-space indentation using the stdlib"""
+    return json.dumps(value, indent=2, sort_keys=False)
+
+
+def _load_json(content: str) -> tuple[Any, Callable[[Any], str]]:
+    """Parse JSON, returning the data and a serializer that renders it faithfully"""
+    if _LONG_DIGITS_RE.search(content) is None:
+        try:
+            return orjson.loads(content), _dumps_orjson
+        except orjson.JSONDecodeError:
+            pass
+    # The stdlib also accepts NaN/Infinity literals and lone surrogates, and writes
+    # them back out where orjson would emit null or fail
+    return json.loads(content), _dumps_stdlib
+
+
+def _format_json(data: Any, dumps: Callable[[Any], str]) -> tuple[list[tuple[str, str]], str]:
+    """Serialize top-level keys as sections and the whole document"""
+    sections = []
+    if isinstance(data, dict):
+        for key, value in data.items():
+            # Format the value as JSON
+            sections.append((str(key), dumps({key: value})))
+
+    # Each section is "{\n  member\n}", so the document is rebuilt from the members
+    # instead of serializing everything again
+    if sections:
+        members = ",\n".join(value_json[2:-2] for _, value_json in sections)
+        return sections, f"{{\n{members}\n}}"
+    return sections, dumps(data)
+
 
 class ExampleParser:
     """Parse YAML and JSON example files and extract structured content"""
@@ -71,7 +123,7 @@ class ExampleParser:
         """Parse YAML content and create structured representation"""
         try:
             # Parse YAML to get structure
-            data = yaml.safe_load(content)
+            data = yaml.load(content, Loader=SafeLoader)
             if data is None:
                 # Empty or comment-only YAML
                 return ParsedContent(
@@ -81,17 +133,27 @@ class ExampleParser:
                     metadata={"file_type": "yaml", "parsed": False},
                 )
 
-            # Format YAML nicely for embedding
-            formatted_yaml = yaml.dump(data, default_flow_style=False, sort_keys=False)
-
             # Extract top-level keys as sections
             sections = []
             if isinstance(data, dict):
                 for key, value in data.items():
                     # Format the value as YAML
-                    value_yaml = yaml.dump({key: value}, default_flow_style=False, sort_keys=False)
+                    value_yaml = yaml.dump(
+                        {key: value}, Dumper=SafeDumper, default_flow_style=False, sort_keys=False
+                    )
                     sections.append((str(key), value_yaml))
 
+            # Format YAML nicely for embedding; a block mapping is its entries in order,
+            # so reuse the section dumps instead of serializing everything again. Only
+            # aliases (*name) make the loader share nodes, which a full dump writes as
+            # anchors that per-key dumps would expand
+            if sections and "*" not in content:
+                formatted_yaml = "".join(value_yaml for _, value_yaml in sections)
+            else:
+                formatted_yaml = yaml.dump(
+                    data, Dumper=SafeDumper, default_flow_style=False, sort_keys=False
+                )
+
             # Combine original content (with comments) and formatted version
             # Include both to preserve comments and formatting
             text_parts = [
@@ -130,18 +192,13 @@ class ExampleParser:
         """Parse JSON content and create structured representation"""
         try:
             # Parse JSON to get structure
-            data = json.loads(content)
-
-            # Format JSON nicely for embedding
-            formatted_json = json.dumps(data, indent=2, sort_keys=False)
+            data, dumps = _load_json(content)
 
-            # Extract top-level keys as sections
-            sections = []
-            if isinstance(data, dict):
-                for key, value in data.items():
-                    # Format the value as JSON
-                    value_json = json.dumps({key: value}, indent=2, sort_keys=False)
-                    sections.append((str(key), value_json))
+            # Format JSON nicely for embedding, with top-level keys as sections
+            try:
+                sections, formatted_json = _format_json(data, dumps)
+            except orjson.JSONEncodeError:
+                sections, formatted_json = _format_json(data, _dumps_stdlib)
 
             # Combine original and formatted version
             text_parts = [
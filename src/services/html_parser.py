@@ -5,13 +5,50 @@ import logging
 import re
 from urllib.parse import urljoin, urlparse
 
-from bs4 import BeautifulSoup
 from pydantic import HttpUrl
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 
 from src.models.website_cache import ParsedContent
 
 logger = logging.getLogger(__name__)
 
+# Elements whose text is never page content
+_NON_CONTENT_TAGS = ["script", "style"]
+
+# Content div classes, in order of preference
+_CONTENT_CLASSES = [
+    "content",
+    "main-content",
+    "documentation",
+    "article",
+    "doc-content",
+    "markdown-body",
+]
+# [class~=...] matches class names case-sensitively, unlike .name in quirks-mode documents
+_CONTENT_SELECTOR = "article, " + ", ".join(f'div[class~="{name}"]' for name in _CONTENT_CLASSES)
+
+# Whitespace normalization applied by clean_text
+_MULTI_SPACE_RE = re.compile(r" {2,}")
+_MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
+
+# The parser replaces NUL in documents, so it can never occur inside a text fragment
+_FRAGMENT_SEPARATOR = "\x00"
+
+
+def _node_text(node: LexborNode, separator: str = "") -> str:
+    """Join the stripped, non-empty text fragments under a node"""
+    # skip_empty only drops ASCII whitespace; fragments such as a lone &nbsp; strip to ""
+    fragments = node.text(separator=_FRAGMENT_SEPARATOR, strip=True).split(_FRAGMENT_SEPARATOR)
+    return separator.join(filter(None, fragments))
+
+
+def _content_rank(node: LexborNode) -> int:
+    """Rank a _CONTENT_SELECTOR match; <article> first, then divs by class preference"""
+    if node.tag == "article":
+        return 0
+    classes = (node.attributes.get("class") or "").split()
+    return 1 + min(_CONTENT_CLASSES.index(name) for name in classes if name in _CONTENT_CLASSES)
+
 
 class ParseError(Exception):
     """Raised when HTML parsing fails"""
@@ -29,12 +66,14 @@ class HtmlParser:
         """Initialize parser"""
         pass
 
-    def parse(self, html_content: str, url: HttpUrl, *, validation: bool = True) -> ParsedContent:
+    def parse(
+        self, html_content: str | bytes, url: HttpUrl, *, validation: bool = True
+    ) -> ParsedContent:
         """
         Parse HTML and extract documentation content
 
         Args:
-            html_content: HTML content to parse
+            html_content: HTML content to parse (bytes are parsed as UTF-8)
             url: Source URL (for context and link resolution)
             validation: Whether to validate content quality (default: True)
 
@@ -50,11 +89,12 @@ class HtmlParser:
         if not html_content or not html_content.strip():
             raise ParseError(url_str, "HTML content is empty")
 
-        # Parse HTML with BeautifulSoup
-        soup = BeautifulSoup(html_content, "lxml")
+        # Parse HTML with lexbor; raw bytes are read as UTF-8 without a Python-level decode
+        tree = LexborHTMLParser(html_content)
+        tree.strip_tags(_NON_CONTENT_TAGS, recursive=True)
 
         # Extract main content
-        main_content, extraction_method = self.extract_main_content(soup)
+        main_content, extraction_method = self.extract_main_content(tree)
 
         if not main_content or not main_content.strip():
             raise ParseError(url_str, "No main content found")
@@ -63,15 +103,15 @@ class HtmlParser:
         main_content = self.clean_text(main_content)
 
         # Extract title
-        title = self._extract_title(soup)
+        title = self._extract_title(tree)
         if not title:
             raise ParseError(url_str, "No title found")
 
         # Extract other elements
-        headings = self._extract_headings(soup)
-        code_blocks = self._extract_code_blocks(soup)
-        links = self.extract_links(soup, url_str)
-        metadata = self.extract_metadata(soup)
+        headings = self._extract_headings(tree)
+        code_blocks = self._extract_code_blocks(tree)
+        links = self.extract_links(tree, url_str)
+        metadata = self.extract_metadata(tree)
 
         # Calculate word count
         word_count = len(main_content.split())
@@ -95,12 +135,12 @@ class HtmlParser:
         logger.info(f"Parsed {url_str} using '{extraction_method}' ({word_count} words)")
         return parsed
 
-    def extract_main_content(self, soup: BeautifulSoup) -> tuple[str, str]:
+    def extract_main_content(self, tree: LexborHTMLParser) -> tuple[str, str]:
         """
         Extract main content area from parsed HTML
 
         Args:
-            soup: BeautifulSoup parsed HTML
+            tree: Parsed HTML document
 
         Returns:
             Tuple of (main_content_text, extraction_method)
@@ -110,38 +150,25 @@ class HtmlParser:
             ParseError: If no content can be extracted
         """
         # Strategy 1: Look for <main> tag
-        main_tag = soup.find("main")
+        main_tag = tree.css_first("main")
         if main_tag:
-            return main_tag.get_text(separator="\n", strip=True), "main_tag"
-
-        # Strategy 2: Look for <article> tag
-        article_tag = soup.find("article")
-        if article_tag:
-            return article_tag.get_text(separator="\n", strip=True), "article_tag"
-
-        # Strategy 3: Look for common content div classes
-        content_classes = [
-            "content",
-            "main-content",
-            "documentation",
-            "article",
-            "doc-content",
-            "markdown-body",
-        ]
-        for class_name in content_classes:
-            content_div = soup.find("div", class_=class_name)
-            if content_div:
-                return content_div.get_text(separator="\n", strip=True), "content_div"
+            return _node_text(main_tag, "\n"), "main_tag"
+
+        # Strategies 2 and 3: <article> tag, then common content div classes, found in
+        # one query; the best-ranked candidate wins, earliest in the document on ties
+        content_node = min(tree.css(_CONTENT_SELECTOR), key=_content_rank, default=None)
+        if content_node:
+            method = "article_tag" if content_node.tag == "article" else "content_div"
+            return _node_text(content_node, "\n"), method
 
         # Strategy 4: Fallback - extract body with aggressive filtering
         logger.warning("Using fallback extraction strategy - no semantic HTML tags found")
-        body = soup.find("body")
+        body = tree.body
         if not body:
             raise ParseError("unknown", "No <body> tag found")
 
         # Remove unwanted elements
-        for tag in body.find_all(["nav", "header", "footer", "aside", "script", "style"]):
-            tag.decompose()
+        body.strip_tags(["nav", "header", "footer", "aside", "script", "style"], recursive=True)
 
         # Remove elements with navigation/sidebar classes
         unwanted_classes = [
@@ -153,29 +180,32 @@ class HtmlParser:
             "breadcrumb",
             "toc",
         ]
-        for class_name in unwanted_classes:
-            for elem in body.find_all(class_=class_name):
-                elem.decompose()
+        # [class~=...] stays case-sensitive in quirks mode. Matches come in document
+        # order; removing the innermost first never touches a node freed with an ancestor
+        selector = ", ".join(f'[class~="{name}"]' for name in unwanted_classes)
+        for elem in reversed(body.css(selector)):
+            elem.decompose()
 
-        content = body.get_text(separator="\n", strip=True)
+        content = _node_text(body, "\n")
         return content, "fallback"
 
-    def extract_links(self, soup: BeautifulSoup, base_url: str) -> list[str]:
+    def extract_links(self, tree: LexborHTMLParser, base_url: str) -> list[str]:
         """
         Extract all internal links from HTML
 
         Args:
-            soup: BeautifulSoup parsed HTML
+            tree: Parsed HTML document
             base_url: Base URL for resolving relative links
 
         Returns:
             List of absolute URLs (deduplicated)
         """
-        links = []
+        # Insertion-ordered set of clean URLs
+        links: dict[str, None] = {}
         base_parsed = urlparse(base_url)
 
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
+        for link in tree.css("a[href]"):
+            href = link.attributes.get("href")
             if not isinstance(href, str):
                 continue
 
@@ -188,21 +218,21 @@ class HtmlParser:
                 clean_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
 
                 # Only keep same-domain links
-                if parsed.netloc == base_parsed.netloc and clean_url not in links:
-                    links.append(clean_url)
+                if parsed.netloc == base_parsed.netloc:
+                    links[clean_url] = None
 
             except Exception as e:
                 logger.warning(f"Failed to parse link {href}: {e}")
                 continue
 
-        return links
+        return list(links)
 
-    def extract_metadata(self, soup: BeautifulSoup) -> dict[str, str]:
+    def extract_metadata(self, tree: LexborHTMLParser) -> dict[str, str]:
         """
         Extract metadata from HTML (meta tags, title, etc.)
 
         Args:
-            soup: BeautifulSoup parsed HTML
+            tree: Parsed HTML document
 
         Returns:
             Dictionary of metadata key-value pairs
@@ -210,21 +240,21 @@ class HtmlParser:
         metadata: dict[str, str] = {}
 
         # Extract meta description
-        desc_tag = soup.find("meta", attrs={"name": "description"}) or soup.find(
-            "meta", attrs={"property": "og:description"}
+        desc_tag = tree.css_first('meta[name="description"]') or tree.css_first(
+            'meta[property="og:description"]'
         )
-        if desc_tag and desc_tag.get("content"):
-            metadata["description"] = desc_tag["content"]
+        if desc_tag and (content := desc_tag.attributes.get("content")):
+            metadata["description"] = content
 
         # Extract meta author
-        author_tag = soup.find("meta", attrs={"name": "author"})
-        if author_tag and author_tag.get("content"):
-            metadata["author"] = author_tag["content"]
+        author_tag = tree.css_first('meta[name="author"]')
+        if author_tag and (content := author_tag.attributes.get("content")):
+            metadata["author"] = content
 
         # Extract meta keywords
-        keywords_tag = soup.find("meta", attrs={"name": "keywords"})
-        if keywords_tag and keywords_tag.get("content"):
-            metadata["keywords"] = keywords_tag["content"]
+        keywords_tag = tree.css_first('meta[name="keywords"]')
+        if keywords_tag and (content := keywords_tag.attributes.get("content")):
+            metadata["keywords"] = content
 
         return metadata
 
@@ -243,61 +273,59 @@ class HtmlParser:
         text = html.unescape(text)
 
         # Collapse multiple spaces to single space
-        text = re.sub(r" +", " ", text)
+        text = _MULTI_SPACE_RE.sub(" ", text)
 
         # Collapse 3+ newlines to 2 newlines (paragraph separation)
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = _MULTI_NEWLINE_RE.sub("\n\n", text)
 
         # Strip leading/trailing whitespace
         text = text.strip()
 
         return text
 
-    def _extract_title(self, soup: BeautifulSoup) -> str | None:
+    def _extract_title(self, tree: LexborHTMLParser) -> str | None:
         """Extract page title from HTML"""
         # Try <title> tag first
-        title_tag = soup.find("title")
-        if title_tag and title_tag.string:
-            return title_tag.string.strip()
+        title_tag = tree.css_first("title")
+        if title_tag and (title_text := title_tag.text()):
+            return title_text.strip()
 
         # Try first <h1> tag
-        h1_tag = soup.find("h1")
+        h1_tag = tree.css_first("h1")
         if h1_tag:
-            return h1_tag.get_text(strip=True)
+            return _node_text(h1_tag)
 
         # Try og:title meta tag
-        og_title = soup.find("meta", attrs={"property": "og:title"})
-        if og_title and og_title.get("content"):
-            return og_title["content"]
+        og_title = tree.css_first('meta[property="og:title"]')
+        if og_title and og_title.attributes.get("content"):
+            return og_title.attributes["content"]
 
         return None
 
-    def _extract_headings(self, soup: BeautifulSoup) -> list[str]:
-        """Extract all headings (h1-h6) in order"""
+    def _extract_headings(self, tree: LexborHTMLParser) -> list[str]:
+        """Extract all headings (h1-h6) in document order"""
         headings = []
-        for tag_name in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-            for tag in soup.find_all(tag_name):
-                text = tag.get_text(strip=True)
-                if text:
-                    headings.append(text)
+        for tag in tree.css("h1, h2, h3, h4, h5, h6"):
+            text = _node_text(tag)
+            if text:
+                headings.append(text)
         return headings
 
-    def _extract_code_blocks(self, soup: BeautifulSoup) -> list[str]:
+    def _extract_code_blocks(self, tree: LexborHTMLParser) -> list[str]:
         """Extract all code block contents"""
         code_blocks = []
 
         # Extract <pre> blocks
-        for pre in soup.find_all("pre"):
-            code_text = pre.get_text(strip=True)
+        for pre in tree.css("pre"):
+            code_text = _node_text(pre)
             if code_text:
                 code_blocks.append(code_text)
 
         # Extract standalone <code> blocks (not inside <pre>)
-        for code in soup.find_all("code"):
-            if not code.find_parent("pre"):
-                code_text = code.get_text(strip=True)
-                if code_text and len(code_text) > 10:  # Only multi-line code
-                    code_blocks.append(code_text)
+        for code in tree.css("code:not(pre code)"):
+            code_text = _node_text(code)
+            if code_text and len(code_text) > 10:  # Only multi-line code
+                code_blocks.append(code_text)
 
         return code_blocks
 
@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import threading
+from collections.abc import Callable
 from datetime import datetime
 
 from apscheduler.jobstores.base import JobLookupError
@@ -26,17 +27,23 @@ class RefreshException(Exception):
 class RefreshOrchestrator:
     """Orchestrates background refresh of documentation database"""
 
-    def __init__(self, db_swap_lock: threading.Lock | None = None):
+    def __init__(
+        self,
+        db_swap_lock: threading.Lock | None = None,
+        on_swap: Callable[[], None] | None = None,
+    ):
         """
         Initialize refresh orchestrator
 
         Args:
             db_swap_lock: Optional lock to coordinate database swaps with service init
+            on_swap: Optional callback run after the active database has been swapped
         """
         self.config = config
         self.db_manager = DatabaseManager()
         self.scheduler: BackgroundScheduler | None = None
         self.db_swap_lock = db_swap_lock
+        self.on_swap = on_swap
 
     def configure_scheduler_sync(
         self,
@@ -113,11 +120,13 @@ class RefreshOrchestrator:
             # Step 1: Cleanup stale databases
             self.db_manager.cleanup_stale_databases()
 
-            # Step 2: Run rebuild process (async wrapped in sync)
+            # Step 2: Run rebuild process (async wrapped in sync); every page is
+            # refetched so edits to already-cached pages are picked up
             asyncio.run(
                 build(
                     sources_config_path="sources.yaml",
                     db_path=self.config.db_temp_path,
+                    force_refresh=True,
                 )
             )
 
@@ -130,6 +139,8 @@ class RefreshOrchestrator:
                 active_path=self.config.db_path,
                 lock=self.db_swap_lock,
             )
+            if self.on_swap is not None:
+                self.on_swap()
 
             # Update result timing
             end_time = datetime.now()
@@ -1,7 +1,9 @@
 """Search service for querying documentation"""
 
 import time
+from collections import OrderedDict
 
+from src.config import config
 from src.models.query import Query, QueryType
 from src.models.search_result import (
     QueryDocsOutput,
@@ -19,6 +21,23 @@ class SearchService:
     def __init__(self, vector_store: VectorStore):
         self.vector_store = vector_store
         self.embedder = Embedder()
+        # LRU of normalized query text -> embedding; repeated questions skip the model
+        self._query_embeddings: OrderedDict[str, list[float]] = OrderedDict()
+
+    async def _embed_query(self, text: str) -> list[float]:
+        """Embed query text, reusing the embedding of an identical recent query"""
+        key = " ".join(text.split())
+        cached = self._query_embeddings.get(key)
+        if cached is not None:
+            self._query_embeddings.move_to_end(key)
+            return cached
+
+        embedding = await self.embedder.embed_text(key)
+        if config.query_embedding_cache_size > 0:
+            self._query_embeddings[key] = embedding
+            if len(self._query_embeddings) > config.query_embedding_cache_size:
+                self._query_embeddings.popitem(last=False)
+        return embedding
 
     async def query(self, query: Query) -> QueryDocsOutput:
         """
@@ -37,7 +56,7 @@ class SearchService:
         # Handle different query types
         if query.query_type == QueryType.SEMANTIC:
             # Generate query embedding
-            query_embedding = await self.embedder.embed_text(query.text)
+            query_embedding = await self._embed_query(query.text)
 
             # Perform vector similarity search
             raw_results = await self.vector_store.search(query_embedding, limit=query.limit)
@@ -54,7 +73,7 @@ class SearchService:
                     rank=rank,
                     metadata=SearchMetadata(
                         source_url=None,  # TODO: Generate from source_file
-                        breadcrumb=[chunk.section_heading] if chunk.section_heading else [],
+                        breadcrumb=(chunk.section_heading,) if chunk.section_heading else (),
                         match_type="semantic",
                     ),
                 )
@@ -76,7 +95,7 @@ class SearchService:
                     rank=rank,
                     metadata=SearchMetadata(
                         source_url=None,
-                        breadcrumb=[chunk.section_heading] if chunk.section_heading else [],
+                        breadcrumb=(chunk.section_heading,) if chunk.section_heading else (),
                         match_type="keyword",
                     ),
                 )
@@ -84,7 +103,7 @@ class SearchService:
 
         elif query.query_type == QueryType.HYBRID:
             # Perform both semantic and keyword searches
-            query_embedding = await self.embedder.embed_text(query.text)
+            query_embedding = await self._embed_query(query.text)
             semantic_results = await self.vector_store.search(
                 query_embedding, limit=query.limit * 2
             )
@@ -165,7 +184,7 @@ class SearchService:
                 rank=rank,
                 metadata=SearchMetadata(
                     source_url=None,
-                    breadcrumb=[chunk.section_heading] if chunk.section_heading else [],
+                    breadcrumb=(chunk.section_heading,) if chunk.section_heading else (),
                     match_type=match_type,
                 ),
             )
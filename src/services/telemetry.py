@@ -1,10 +1,11 @@
 """OpenTelemetry logging and tracing service for query and response telemetry"""
 
-import json
 import logging
+from collections.abc import Callable
 from datetime import datetime, timezone
 from typing import Any
 
+import orjson
 from opentelemetry import trace
 from opentelemetry._logs import SeverityNumber, set_logger_provider
 from opentelemetry.exporter.otlp.proto.http._log_exporter import OTLPLogExporter
@@ -24,6 +25,11 @@ logger = logging.getLogger(__name__)
 _httpx_instrumentation_initialized = False
 
 
+def _to_json(value: Any) -> bytes:
+    """Encode telemetry payloads with orjson (datetimes keep their str() form)"""
+    return orjson.dumps(value, default=str, option=orjson.OPT_PASSTHROUGH_DATETIME)
+
+
 class TelemetryService:
     """Handle OpenTelemetry logging and tracing for queries and responses"""
 
@@ -137,7 +143,7 @@ class TelemetryService:
         tool_name: str,
         query: str | None,
         parameters: dict[str, Any],
-        response: dict[str, Any] | None = None,
+        response: dict[str, Any] | Callable[[], dict[str, Any]] | None = None,
         error: Exception | None = None,
         metadata: dict[str, Any] | None = None,
     ) -> None:
@@ -148,7 +154,8 @@ class TelemetryService:
             tool_name: Name of the MCP tool being called
             query: The query text (for query_docs) or None
             parameters: All parameters passed to the tool
-            response: The response data (if successful)
+            response: The response data (if successful), or a callable that builds it;
+                the callable is only invoked when telemetry logging is enabled
             error: The error (if failed)
             metadata: Additional metadata (query time, result count, etc.)
         """
@@ -156,6 +163,8 @@ class TelemetryService:
             return
 
         try:
+            data = response if response is None or isinstance(response, dict) else response()
+
             # Build structured attributes (LOW CARDINALITY ONLY)
             attributes: dict[str, str | int | float | bool] = {
                 "mcp.tool.name": tool_name,
@@ -176,14 +185,13 @@ class TelemetryService:
             success = error is None
             attributes["response.success"] = success
 
-            if response:
+            if data:
                 # Add response size
-                response_json = json.dumps(response, default=str)
-                attributes["response.size_bytes"] = len(response_json)
+                attributes["response.size_bytes"] = len(_to_json(data))
 
                 # Add specific response metrics based on tool
-                if tool_name == "query_docs" and "results" in response:
-                    results = response.get("results", [])
+                if tool_name == "query_docs" and "results" in data:
+                    results = data.get("results", [])
                     attributes["response.result_count"] = len(results)
 
                     # Add top result score if available
@@ -193,20 +201,20 @@ class TelemetryService:
                             attributes["response.top_score"] = float(top_score)
 
                     # Add query info if available
-                    query_info = response.get("query_info", {})
+                    query_info = data.get("query_info", {})
                     if "query_time_ms" in query_info:
                         attributes["response.query_time_ms"] = float(query_info["query_time_ms"])
                     if "total_results" in query_info:
                         attributes["response.total_results"] = int(query_info["total_results"])
 
-                elif tool_name == "get_chunk" and "id" in response:
+                elif tool_name == "get_chunk" and "id" in data:
                     attributes["response.chunk_retrieved"] = True
-                    if "content" in response:
-                        attributes["response.content_length"] = len(response["content"])
+                    if "content" in data:
+                        attributes["response.content_length"] = len(data["content"])
 
                         # Store full chunk for analytics (if enabled)
                         if config.otel_log_full_results:
-                            attributes["response.chunk_json"] = json.dumps(response, default=str)
+                            attributes["response.chunk_json"] = _to_json(data).decode()
 
             # Add error information (error types are low cardinality)
             if error:
@@ -241,17 +249,17 @@ class TelemetryService:
                 log_body_parts.append(f"chunk_id={parameters['chunk_id']}")
 
             # Add summary stats
-            if response and tool_name == "query_docs":
-                result_count = len(response.get("results", []))
-                query_info = response.get("query_info", {})
+            if data and tool_name == "query_docs":
+                result_count = len(data.get("results", []))
+                query_info = data.get("query_info", {})
                 query_time = query_info.get("query_time_ms", 0)
                 log_body_parts.append(f"results={result_count} time={query_time:.1f}ms")
 
                 # Add full results for analytics (if enabled)
                 if config.otel_log_full_results:
-                    results = response.get("results", [])
+                    results = data.get("results", [])
                     # Store full results as JSON in attributes for analytics
-                    attributes["response.results_json"] = json.dumps(results, default=str)
+                    attributes["response.results_json"] = _to_json(results).decode()
 
             if error:
                 log_body_parts.append(f"error={type(error).__name__}")
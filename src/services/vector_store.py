@@ -1,7 +1,11 @@
 """SQLite vector store with sqlite_vec extension"""
 
+import math
 import sqlite3
 import struct
+from collections.abc import Generator
+from contextlib import contextmanager
+from datetime import UTC, datetime
 from pathlib import Path
 
 import sqlite_vec
@@ -10,6 +14,21 @@ from src.config import config
 from src.models.chunk import DocumentationChunk
 from src.models.source import DocumentationSource
 
+# Bumped whenever the layout of stored vectors changes (2: int8 with cosine distance)
+# Kept in PRAGMA user_version; an older vec_chunks table is dropped and rebuilt
+VEC_SCHEMA_VERSION = 2
+
+
+def _quantize_int8(embedding: list[float]) -> bytes:
+    """
+    Quantize an embedding to int8 for the vec0 table
+
+    Each vector is scaled so its largest component maps to 127. Cosine distance
+    ignores vector length, so the per-vector scale does not need to be stored.
+    """
+    scale = max(abs(value) for value in embedding) / 127 or 1.0
+    return struct.pack(f"{len(embedding)}b", *(round(value / scale) for value in embedding))
+
 
 class VectorStore:
     """SQLite-based vector store for documentation chunks and embeddings"""
@@ -74,6 +93,36 @@ class VectorStore:
         should_close = self.db_path != ":memory:"
         return new_conn, should_close
 
+    @contextmanager
+    def bulk_load_connection(self) -> Generator[sqlite3.Connection]:
+        """
+        Connection tuned for bulk writes during a build
+
+        Switches to WAL with synchronous=NORMAL so commits do not fsync, keeps
+        temp data in memory and memory-maps the file. Build-time only: the
+        journal mode and sync level are restored on exit so the finished
+        database is a single self-contained file again.
+
+        Yields:
+            Connection to pass as conn= to insert methods
+        """
+        conn = self._get_connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute(f"PRAGMA mmap_size={1 << 30}")
+        try:
+            yield conn
+        finally:
+            # The sync level cannot change inside a transaction a failed insert left open
+            conn.rollback()
+            try:
+                conn.execute("PRAGMA synchronous=FULL")
+                conn.execute("PRAGMA journal_mode=DELETE")
+            finally:
+                if self.db_path != ":memory:":
+                    conn.close()
+
     async def initialize(self) -> None:
         """
         Initialize database and create tables
@@ -130,13 +179,20 @@ class VectorStore:
                 ON chunks(created_at)
             """)
 
+            # A vec_chunks table from an older build stores vectors in a layout the
+            # inserts and queries below cannot read, so drop it and let the build refill it
+            if conn.execute("PRAGMA user_version").fetchone()[0] != VEC_SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS vec_chunks")
+                conn.execute(f"PRAGMA user_version={VEC_SCHEMA_VERSION}")
+
             # Create vec0 virtual table for embeddings using sqlite_vec
             # vec0 is optimized for vector similarity search
+            # Vectors are stored as int8 (1 byte per dimension instead of 4)
             embedding_dim = config.embedding_dimension
             conn.execute(f"""
                 CREATE VIRTUAL TABLE IF NOT EXISTS vec_chunks USING vec0(
                     chunk_id TEXT PRIMARY KEY,
-                    embedding FLOAT[{embedding_dim}]
+                    embedding INT8[{embedding_dim}] distance_metric=cosine
                 )
             """)
 
@@ -192,72 +248,106 @@ class VectorStore:
             embedding: Vector embedding
             conn: Optional connection (for transactions)
         """
-        conn, should_close = self._ensure_connection(conn)
+        await self.insert_chunks_batch([chunk], [embedding], conn=conn)
 
-        try:
-            # Validate embedding dimension
-            expected_dim = config.embedding_dimension
+    async def insert_chunks_batch(
+        self,
+        chunks: list[DocumentationChunk],
+        embeddings: list[list[float]],
+        conn: sqlite3.Connection | None = None,
+        metadata: DocumentationSource | None = None,
+    ) -> None:
+        """
+        Insert multiple chunks and their embeddings in a single transaction
+
+        Args:
+            chunks: Documentation chunks to insert
+            embeddings: Vector embeddings (same order as chunks)
+            conn: Optional connection (for transactions)
+            metadata: Optional build metadata, written in the same transaction
+        """
+        if len(chunks) != len(embeddings):
+            raise ValueError(
+                f"Got {len(chunks)} chunks but {len(embeddings)} embeddings; counts must match"
+            )
+
+        # Validate embedding dimension
+        expected_dim = config.embedding_dimension
+        for embedding in embeddings:
             if len(embedding) != expected_dim:
                 raise ValueError(
                     f"Embedding dimension mismatch: expected {expected_dim}, got {len(embedding)}"
                 )
 
-            # Insert chunk
-            conn.execute(
+        if not chunks:
+            if metadata is not None:
+                self.update_metadata(metadata, conn=conn)
+            return
+
+        conn, should_close = self._ensure_connection(conn)
+
+        try:
+            # Insert chunks
+            conn.executemany(
                 """
                 INSERT OR REPLACE INTO chunks (
                     id, content, source_file, section_heading,
                     chunk_position, token_count, created_at
                 ) VALUES (?, ?, ?, ?, ?, ?, ?)
             """,
-                (
-                    chunk.id,
-                    chunk.content,
-                    chunk.source_file,
-                    chunk.section_heading,
-                    chunk.chunk_position,
-                    chunk.token_count,
-                    chunk.created_at.isoformat(),
-                ),
+                [
+                    (
+                        chunk.id,
+                        chunk.content,
+                        chunk.source_file,
+                        chunk.section_heading,
+                        chunk.chunk_position,
+                        chunk.token_count,
+                        chunk.created_at.isoformat(),
+                    )
+                    for chunk in chunks
+                ],
             )
 
-            # Insert embedding into vec0 virtual table
-            # Convert list to serialized format for vec0
-            embedding_bytes = struct.pack(f"{len(embedding)}f", *embedding)
-
-            conn.execute(
+            # Insert embeddings into vec0 virtual table
+            # Quantize to int8 and tag the blob as an int8 vector for vec0
+            conn.executemany(
                 """
                 INSERT OR REPLACE INTO vec_chunks (chunk_id, embedding)
-                VALUES (?, ?)
+                VALUES (?, vec_int8(?))
             """,
-                (chunk.id, embedding_bytes),
+                [
+                    (chunk.id, _quantize_int8(embedding))
+                    for chunk, embedding in zip(chunks, embeddings, strict=True)
+                ],
             )
 
             # Insert metadata
-            conn.execute(
+            conn.executemany(
                 """
                 INSERT OR REPLACE INTO chunk_embeddings_metadata (
                     chunk_id, model_name, created_at
                 ) VALUES (?, ?, datetime('now'))
             """,
-                (chunk.id, config.embedding_model),
+                [(chunk.id, config.embedding_model) for chunk in chunks],
             )
 
             # Insert into FTS5 table for full-text search
-            conn.execute(
+            conn.executemany(
                 """
                 INSERT OR REPLACE INTO chunks_fts (
                     chunk_id, content, source_file, section_heading
                 ) VALUES (?, ?, ?, ?)
             """,
-                (
-                    chunk.id,
-                    chunk.content,
-                    chunk.source_file,
-                    chunk.section_heading,
-                ),
+                [
+                    (chunk.id, chunk.content, chunk.source_file, chunk.section_heading)
+                    for chunk in chunks
+                ],
             )
 
+            if metadata is not None:
+                self._write_metadata(conn, metadata)
+
             conn.commit()
         finally:
             if should_close:
@@ -290,8 +380,8 @@ class VectorStore:
                     f"got {len(query_embedding)}"
                 )
 
-            # Serialize query embedding for vec0
-            query_bytes = struct.pack(f"{len(query_embedding)}f", *query_embedding)
+            # Quantize query embedding the same way as stored vectors
+            query_bytes = _quantize_int8(query_embedding)
 
             # Use vec0's KNN search with distance metric
             # The distance column will contain the cosine distance (lower is more similar)
@@ -304,7 +394,7 @@ class VectorStore:
                     v.distance
                 FROM vec_chunks v
                 INNER JOIN chunks c ON v.chunk_id = c.id
-                WHERE v.embedding MATCH ? AND k = ?
+                WHERE v.embedding MATCH vec_int8(?) AND k = ?
                 ORDER BY v.distance
             """,
                 (query_bytes, limit),
@@ -321,9 +411,9 @@ class VectorStore:
                     token_count=row["token_count"],
                     created_at=row["created_at"],
                 )
-                # Convert distance to similarity score (1 - distance for cosine)
-                # Distance is in range [0, 2], convert to similarity [0, 1]
-                distance = row["distance"]
+                # Convert cosine distance to the L2 distance between the unit vectors
+                # (range [0, 2]) so scores keep the scale min_score was tuned for
+                distance = math.sqrt(2.0 * max(row["distance"], 0.0))
                 similarity = 1.0 - (distance / 2.0)
                 results.append((chunk, similarity))
 
@@ -475,25 +565,34 @@ class VectorStore:
         conn, should_close = self._ensure_connection(conn)
 
         try:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO metadata (
-                    id, sources_summary, local_path, last_sync, total_files, total_chunks
-                ) VALUES (1, ?, ?, datetime('now'), ?, ?)
-            """,
-                (
-                    metadata.sources_summary,
-                    metadata.local_path,
-                    metadata.total_files,
-                    metadata.total_chunks,
-                ),
-            )
-
+            self._write_metadata(conn, metadata)
             conn.commit()
         finally:
             if should_close:
                 conn.close()
 
+    @staticmethod
+    def _write_metadata(conn: sqlite3.Connection, metadata: DocumentationSource) -> None:
+        """Write the metadata row without committing"""
+        # Same UTC text format SQLite's datetime('now') produces
+        last_sync = (
+            (metadata.last_sync or datetime.now(UTC)).astimezone(UTC).strftime("%Y-%m-%d %H:%M:%S")
+        )
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO metadata (
+                id, sources_summary, local_path, last_sync, total_files, total_chunks
+            ) VALUES (1, ?, ?, ?, ?, ?)
+        """,
+            (
+                metadata.sources_summary,
+                metadata.local_path,
+                last_sync,
+                metadata.total_files,
+                metadata.total_chunks,
+            ),
+        )
+
     def close(self) -> None:
         """
         Close database connection
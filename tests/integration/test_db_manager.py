@@ -142,6 +142,28 @@ class TestDatabaseManager:
         backup_files = list(Path(temp_dir).glob("active.db.backup-*"))
         assert len(backup_files) == 2
 
+    @pytest.mark.asyncio
+    async def test_cleanup_old_backups_orders_by_name_not_mtime(self, temp_dir):
+        """Test the newest backup by name suffix is kept even when its mtime is oldest"""
+        manager = DatabaseManager()
+
+        active_path = os.path.join(temp_dir, "active.db")
+        names = [
+            "active.db.backup-20241201-120000",
+            "active.db.backup-1733054400000000000",
+            "active.db.backup-1733054400000000001",
+        ]
+        for age, name in enumerate(names):
+            backup_file = Path(temp_dir) / name
+            backup_file.touch()
+            # Copied or restored files: mtimes run opposite to creation order
+            os.utime(backup_file, ns=(10 - age, 10 - age))
+
+        manager._cleanup_old_backups(active_path, keep_count=2)
+
+        remaining = sorted(path.name for path in Path(temp_dir).glob("active.db.backup-*"))
+        assert remaining == names[1:]
+
     @pytest.mark.asyncio
     async def test_cleanup_stale_databases(self, temp_dir):
         """Test cleanup of stale temporary databases"""
@@ -1,5 +1,7 @@
 """Integration tests for MCP server refresh orchestrator integration"""
 
+import asyncio
+import os
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -158,3 +160,92 @@ class TestMCPRefreshIntegration:
             _shutdown_sync()
         except Exception:
             pytest.fail("Shutdown should handle None orchestrator gracefully")
+
+
+class TestGetChunkCache:
+    """Test cached get_chunk responses follow the database file on disk"""
+
+    @staticmethod
+    async def _build_db(db_path, chunk_id, content):
+        """Create a database holding a single chunk"""
+        from src.models.chunk import DocumentationChunk
+        from src.services.vector_store import VectorStore
+
+        store = VectorStore(db_path=str(db_path))
+        await store.initialize()
+        chunk = DocumentationChunk(
+            id=chunk_id, content=content, source_file="docs/a.md", chunk_position=0, token_count=2
+        )
+        await store.insert_chunks_batch([chunk], [[1.0] * 384])
+
+    @pytest.mark.asyncio
+    async def test_get_chunk_sees_database_replaced_on_disk(self, tmp_path):
+        """Test a database swapped outside the server is not served from the cache"""
+        import src.mcp_server
+        from src.mcp_server import get_chunk
+
+        chunk_id = "0b6f1c1e-2f5a-4f4e-9a53-6f3f7c1f2a10"
+        db_path = tmp_path / "docs.db"
+        await self._build_db(db_path, chunk_id, "old content")
+
+        with (
+            patch.object(src.mcp_server.config, "db_path", str(db_path)),
+            patch("src.mcp_server.SearchService"),
+            patch("src.mcp_server.get_telemetry_service"),
+        ):
+            src.mcp_server._vector_store = None
+            src.mcp_server._search_service = None
+            try:
+                first = await get_chunk(chunk_id)
+                first["content"] = "mutated by caller"
+                assert (await get_chunk(chunk_id))["content"] == "old content"
+
+                new_path = tmp_path / "new.db"
+                await self._build_db(new_path, chunk_id, "new content")
+                os.replace(new_path, db_path)
+
+                assert (await get_chunk(chunk_id))["content"] == "new content"
+            finally:
+                src.mcp_server._vector_store = None
+                src.mcp_server._search_service = None
+
+
+class TestDbSwapLock:
+    """Test waiting for the database swap lock from the event loop"""
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_swap_to_release(self):
+        """Test the waiter takes the lock once the swap releases it"""
+        from src.mcp_server import _acquire_db_swap_lock, _db_swap_lock
+
+        _db_swap_lock.acquire()
+        waiter = asyncio.create_task(_acquire_db_swap_lock())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        _db_swap_lock.release()
+        await asyncio.wait_for(waiter, timeout=1)
+
+        assert _db_swap_lock.locked()
+        _db_swap_lock.release()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_keep_the_lock(self):
+        """Test a request cancelled while waiting leaves the lock free"""
+        from src.mcp_server import _acquire_db_swap_lock, _db_swap_lock
+
+        _db_swap_lock.acquire()
+        waiter = asyncio.create_task(_acquire_db_swap_lock())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        _db_swap_lock.release()
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if _db_swap_lock.acquire(blocking=False):
+                break
+        else:
+            pytest.fail("Swap lock was never released after the cancelled acquire")
+        _db_swap_lock.release()
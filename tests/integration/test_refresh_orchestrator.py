@@ -8,7 +8,7 @@ from unittest.mock import patch
 
 import pytest
 
-from src.services.refresh_orchestrator import RefreshOrchestrator
+from src.services.refresh_orchestrator import RefreshException, RefreshOrchestrator
 
 
 class TestRefreshOrchestrator:
@@ -50,10 +50,10 @@ class TestRefreshOrchestrator:
         active_db, temp_db = setup_databases
 
         # Mock build function to create valid temp database
-        async def mock_build(sources_config_path, db_path):
+        async def mock_build(sources_config_path, db_path, force_refresh=False):
             self.create_valid_database(db_path)
 
-        with patch("src.services.refresh_orchestrator.build", side_effect=mock_build):
+        with patch("src.services.refresh_orchestrator.build", side_effect=mock_build) as build_mock:
             with patch("src.services.refresh_orchestrator.config") as mock_config:
                 mock_config.db_path = active_db
                 mock_config.db_temp_path = temp_db
@@ -64,6 +64,7 @@ class TestRefreshOrchestrator:
 
                 # Verify success
                 assert result.success is True
+                assert build_mock.call_args.kwargs["force_refresh"] is True
                 assert result.error is None
                 assert result.duration_seconds > 0
 
@@ -80,7 +81,7 @@ class TestRefreshOrchestrator:
         active_db, temp_db = setup_databases
 
         # Mock build function to raise exception
-        async def mock_build_failure(sources_config_path, db_path):
+        async def mock_build_failure(sources_config_path, db_path, force_refresh=False):
             raise Exception("Build failed: network error")
 
         with patch("src.services.refresh_orchestrator.build", side_effect=mock_build_failure):
@@ -99,12 +100,37 @@ class TestRefreshOrchestrator:
                 # Verify active database is unchanged
                 assert os.path.exists(active_db)
 
+    def test_on_swap_runs_only_after_successful_swap(self, temp_dir, setup_databases):
+        """Test the swap callback fires after a successful swap but not after a failed build"""
+        active_db, temp_db = setup_databases
+        swaps = []
+
+        async def mock_build(sources_config_path, db_path, force_refresh=False):
+            self.create_valid_database(db_path)
+
+        async def mock_build_failure(sources_config_path, db_path, force_refresh=False):
+            raise Exception("Build failed")
+
+        with patch("src.services.refresh_orchestrator.config") as mock_config:
+            mock_config.db_path = active_db
+            mock_config.db_temp_path = temp_db
+            orchestrator = RefreshOrchestrator(on_swap=lambda: swaps.append(True))
+
+            with patch("src.services.refresh_orchestrator.build", side_effect=mock_build_failure):
+                with pytest.raises(RefreshException):
+                    orchestrator.refresh_once()
+            assert swaps == []
+
+            with patch("src.services.refresh_orchestrator.build", side_effect=mock_build):
+                orchestrator.refresh_once()
+            assert swaps == [True]
+
     def test_refresh_with_invalid_temp_database(self, temp_dir, setup_databases):
         """Test refresh fails when temp database is invalid"""
         active_db, temp_db = setup_databases
 
         # Mock build to create invalid database
-        async def mock_build_invalid(sources_config_path, db_path):
+        async def mock_build_invalid(sources_config_path, db_path, force_refresh=False):
             # Create database with wrong schema
             conn = sqlite3.connect(db_path)
             conn.execute("CREATE TABLE wrong_table (id INTEGER)")
@@ -134,7 +160,7 @@ class TestRefreshOrchestrator:
         # Create stale temp database
         Path(temp_db).touch()
 
-        async def mock_build(sources_config_path, db_path):
+        async def mock_build(sources_config_path, db_path, force_refresh=False):
             # Verify stale database was removed
             # Create new valid database
             self.create_valid_database(db_path)
@@ -153,7 +179,7 @@ class TestRefreshOrchestrator:
         """Test that refresh timing is accurately captured"""
         active_db, temp_db = setup_databases
 
-        async def mock_build(sources_config_path, db_path):
+        async def mock_build(sources_config_path, db_path, force_refresh=False):
             # Create valid database
             self.create_valid_database(db_path)
 
@@ -179,7 +205,7 @@ class TestRefreshOrchestrator:
         # Record original active database content
         original_exists = os.path.exists(active_db)
 
-        async def mock_build_exception(sources_config_path, db_path):
+        async def mock_build_exception(sources_config_path, db_path, force_refresh=False):
             raise RuntimeError("Unexpected error during build")
 
         with patch(
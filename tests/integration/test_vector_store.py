@@ -0,0 +1,185 @@
+"""Integration tests for VectorStore"""
+
+import sqlite3
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+
+from src.models.chunk import DocumentationChunk
+from src.models.source import DocumentationSource
+from src.services.vector_store import VectorStore
+
+
+def _make_chunks(count: int) -> list[DocumentationChunk]:
+    """Create simple test chunks"""
+    return [
+        DocumentationChunk(
+            content=f"Test content number {i} about webhooks",
+            source_file=f"docs/page-{i}.md",
+            section_heading=f"Section {i}",
+            chunk_position=0,
+            token_count=7,
+        )
+        for i in range(count)
+    ]
+
+
+class TestVectorStore:
+    """Test chunk persistence in the vector store"""
+
+    @pytest.fixture
+    async def vector_store(self):
+        """Create an initialized in-memory vector store"""
+        store = VectorStore(db_path=":memory:")
+        await store.initialize()
+        yield store
+        store.close()
+
+    @pytest.mark.asyncio
+    async def test_insert_chunks_batch(self, vector_store):
+        """Test batch insert stores every chunk and is searchable"""
+        chunks = _make_chunks(5)
+        embeddings = [[float(i + 1)] + [0.0] * 383 for i in range(5)]
+
+        await vector_store.insert_chunks_batch(chunks, embeddings)
+
+        assert await vector_store.count_chunks() == 5
+        stored = await vector_store.get_chunk(chunks[2].id)
+        assert stored is not None
+        assert stored.content == chunks[2].content
+
+        keyword_results = await vector_store.keyword_search("webhooks", limit=10)
+        assert len(keyword_results) == 5
+
+        semantic_results = await vector_store.search(embeddings[0], limit=1)
+        assert len(semantic_results) == 1
+
+    @pytest.mark.asyncio
+    async def test_insert_chunks_batch_rejects_mismatched_lengths(self, vector_store):
+        """Test batch insert fails when chunk and embedding counts differ"""
+        chunks = _make_chunks(2)
+
+        with pytest.raises(ValueError, match="counts must match"):
+            await vector_store.insert_chunks_batch(chunks, [[0.0] * 384])
+
+        assert await vector_store.count_chunks() == 0
+
+    @pytest.mark.asyncio
+    async def test_insert_chunks_batch_rejects_wrong_dimension(self, vector_store):
+        """Test batch insert validates embedding dimension before writing"""
+        chunks = _make_chunks(2)
+
+        with pytest.raises(ValueError, match="dimension mismatch"):
+            await vector_store.insert_chunks_batch(chunks, [[0.0] * 384, [0.0] * 10])
+
+        assert await vector_store.count_chunks() == 0
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_quantized_embeddings(self, vector_store):
+        """Test int8-quantized vectors still rank the closest chunk first"""
+        chunks = _make_chunks(3)
+        embeddings = []
+        for i in range(3):
+            embedding = [0.01] * 384
+            embedding[i] = 0.9
+            embeddings.append(embedding)
+        await vector_store.insert_chunks_batch(chunks, embeddings)
+
+        query = [0.0] * 384
+        query[1] = 1.0
+        results = await vector_store.search(query, limit=3)
+
+        assert [chunk.id for chunk, _ in results][0] == chunks[1].id
+        assert results[0][1] > 0.85
+        assert results[0][1] > results[1][1]
+
+    @pytest.mark.asyncio
+    async def test_bulk_load_connection_restores_journal_mode(self, tmp_path):
+        """Test bulk loading writes chunks and leaves the database out of WAL mode"""
+        store = VectorStore(db_path=str(tmp_path / "docs.db"))
+        await store.initialize()
+        chunks = _make_chunks(3)
+
+        with store.bulk_load_connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            await store.insert_chunks_batch(chunks, [[1.0] * 384] * 3, conn=conn)
+
+        assert await store.count_chunks() == 3
+        conn = store._get_connection()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        conn.close()
+        assert not (tmp_path / "docs.db-wal").exists()
+
+    @pytest.mark.asyncio
+    async def test_bulk_load_connection_failed_insert_keeps_error(self, tmp_path):
+        """Test a failure mid-transaction is re-raised and the database still restored"""
+        store = VectorStore(db_path=str(tmp_path / "docs.db"))
+        await store.initialize()
+
+        with pytest.raises(sqlite3.IntegrityError):
+            with store.bulk_load_connection() as conn:
+                conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+                conn.execute("INSERT INTO t VALUES (1)")
+                conn.execute("INSERT INTO t VALUES (1)")
+
+        conn = store._get_connection()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        conn.close()
+
+    @pytest.mark.asyncio
+    async def test_initialize_rebuilds_float_vec_table(self, tmp_path):
+        """Test a database built with float vectors is migrated to the int8 table"""
+        db_path = str(tmp_path / "docs.db")
+        store = VectorStore(db_path=db_path)
+        conn = store._get_connection()
+        conn.execute(
+            "CREATE VIRTUAL TABLE vec_chunks USING vec0("
+            "chunk_id TEXT PRIMARY KEY, embedding FLOAT[384])"
+        )
+        conn.commit()
+        conn.close()
+
+        await store.initialize()
+        chunks = _make_chunks(1)
+        await store.insert_chunks_batch(chunks, [[1.0] * 384])
+
+        results = await store.search([1.0] * 384, limit=1)
+        assert results[0][0].id == chunks[0].id
+        assert results[0][1] == pytest.approx(1.0, abs=1e-3)
+
+    @pytest.mark.asyncio
+    async def test_update_metadata_stores_last_sync(self, vector_store):
+        """Test metadata rows use the provided last_sync timestamp"""
+        metadata = DocumentationSource(
+            sources_summary="website: docs",
+            local_path="./cache",
+            last_sync=datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC),
+            total_files=1,
+            total_chunks=2,
+        )
+
+        vector_store.update_metadata(metadata)
+
+        conn = vector_store._get_connection()
+        row = conn.execute("SELECT last_sync, total_chunks FROM metadata WHERE id = 1").fetchone()
+        assert tuple(row) == ("2025-01-02 03:04:05", 2)
+
+    @pytest.mark.asyncio
+    async def test_insert_chunks_batch_writes_metadata_in_same_transaction(self, vector_store):
+        """Test metadata passed with a batch is committed with it, converted to UTC"""
+        metadata = DocumentationSource(
+            sources_summary="website: docs",
+            local_path="./cache",
+            last_sync=datetime(2025, 1, 2, 5, 4, 5, tzinfo=timezone(timedelta(hours=2))),
+            total_files=1,
+            total_chunks=2,
+        )
+
+        await vector_store.insert_chunks_batch(
+            _make_chunks(2), [[1.0] * 384] * 2, metadata=metadata
+        )
+
+        conn = vector_store._get_connection()
+        row = conn.execute("SELECT last_sync, total_chunks FROM metadata WHERE id = 1").fetchone()
+        assert tuple(row) == ("2025-01-02 03:04:05", 2)
+        assert await vector_store.count_chunks() == 2
@@ -0,0 +1,33 @@
+"""Unit tests for build orchestration helpers"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.build import _gather_sources, config
+
+
+async def _ok(value):
+    """Source sync that succeeds"""
+    return value
+
+
+async def _fail():
+    """Source sync that fails"""
+    raise RuntimeError("repository unavailable")
+
+
+@pytest.mark.asyncio
+async def test_gather_sources_skips_failed_source():
+    """Test one failing source does not abort the others"""
+    assert await _gather_sources([_ok(1), _fail(), _ok(3)]) == [1, None, 3]
+
+
+@pytest.mark.asyncio
+async def test_gather_sources_can_fail_the_build():
+    """Test fail_on_source_error re-raises the failure"""
+    with (
+        patch.object(config, "fail_on_source_error", True),
+        pytest.raises(RuntimeError, match="repository unavailable"),
+    ):
+        await _gather_sources([_ok(1), _fail()])
@@ -0,0 +1,75 @@
+"""Unit tests for the chunk cache"""
+
+from src.models.chunk import DocumentationChunk
+from src.services.chunk_cache import ChunkCache
+
+
+def _chunk(content: str, position: int = 0) -> DocumentationChunk:
+    """Create a simple test chunk"""
+    return DocumentationChunk(
+        content=content,
+        source_file="https://example.com/page",
+        section_heading="Intro",
+        chunk_position=position,
+        token_count=3,
+    )
+
+
+def test_file_key_depends_on_content_url_and_kind():
+    """Test keys change with anything that affects the parsed chunks"""
+    key = ChunkCache.file_key(b"<html></html>", "https://example.com/a", "html")
+
+    assert key == ChunkCache.file_key(b"<html></html>", "https://example.com/a", "html")
+    assert key != ChunkCache.file_key(b"<html> </html>", "https://example.com/a", "html")
+    assert key != ChunkCache.file_key(b"<html></html>", "https://example.com/b", "html")
+    assert key != ChunkCache.file_key(b"<html></html>", "https://example.com/a", "markdown")
+
+
+def test_put_and_get_many_returns_fresh_chunks():
+    """Test cached chunks round-trip with new ids"""
+    cache = ChunkCache(db_path=":memory:")
+    key = ChunkCache.file_key(b"content", "https://example.com/page", "html")
+    missing = ChunkCache.file_key(b"other", "https://example.com/page", "html")
+    chunks = [_chunk("First chunk text"), _chunk("Second chunk text", position=1)]
+
+    cache.put_many([(key, chunks)])
+    found = cache.get_many([key, missing])
+
+    assert list(found) == [key]
+    restored = found[key]
+    assert [c.content for c in restored] == [c.content for c in chunks]
+    assert [c.chunk_position for c in restored] == [0, 1]
+    assert restored[0].section_heading == "Intro"
+    assert {c.id for c in restored}.isdisjoint(c.id for c in chunks)
+    cache.close()
+
+
+def test_empty_chunk_lists_are_cached():
+    """Test files that produce no chunks are still remembered"""
+    cache = ChunkCache(db_path=":memory:")
+    key = ChunkCache.file_key(b"", "https://example.com/empty", "markdown")
+
+    cache.put_many([(key, [])])
+
+    assert cache.get_many([key]) == {key: []}
+    cache.close()
+
+
+def test_prune_keeps_only_keys_used_by_this_build(tmp_path):
+    """Test pruning drops entries the current build neither read nor wrote"""
+    db_path = str(tmp_path / "chunks.db")
+    old_key = ChunkCache.file_key(b"old", "https://example.com/old", "html")
+    kept_key = ChunkCache.file_key(b"kept", "https://example.com/kept", "html")
+    new_key = ChunkCache.file_key(b"new", "https://example.com/new", "html")
+
+    cache = ChunkCache(db_path=db_path)
+    cache.put_many([(old_key, [_chunk("Old chunk text")]), (kept_key, [_chunk("Kept text")])])
+    cache.close()
+
+    cache = ChunkCache(db_path=db_path)
+    assert list(cache.get_many([kept_key, new_key])) == [kept_key]
+    cache.put_many([(new_key, [_chunk("New chunk text")])])
+
+    assert cache.prune() == 1
+    assert set(cache.get_many([old_key, kept_key, new_key])) == {kept_key, new_key}
+    cache.close()
@@ -0,0 +1,104 @@
+"""Unit tests for the website documentation sync service"""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from pydantic import HttpUrl
+
+from src.models.sources_config import FetchingConfig
+from src.models.website_cache import CachedPage, CacheMetadata, FetchResult
+from src.services.doc_sync import DocSync
+
+
+@pytest.mark.asyncio
+async def test_incremental_sync_skips_cached_pages():
+    """Test discovered HttpUrls are matched against the string-keyed page cache"""
+    doc_sync = DocSync(base_url="https://docs.example.com", path_prefix="/")
+    cached_url = HttpUrl("https://docs.example.com/cached")
+    new_url = HttpUrl("https://docs.example.com/new")
+    doc_sync.fetcher.discover_pages = AsyncMock(return_value=[cached_url, new_url])
+
+    cache_metadata = CacheMetadata(
+        base_url="https://docs.example.com",
+        last_full_sync=datetime.now(),
+        total_pages=1,
+        pages={
+            str(cached_url): CachedPage(
+                url=cached_url,
+                url_hash="a" * 64,
+                fetch_timestamp=datetime.now(),
+                content_hash="b" * 64,
+                content_length=10,
+                http_status=200,
+            )
+        },
+    )
+
+    _, urls_to_fetch = await doc_sync._discover_and_filter_pages(
+        cache_metadata, force_refresh=False, incremental=True
+    )
+
+    assert urls_to_fetch == [new_url]
+
+
+@pytest.mark.asyncio
+async def test_incremental_sync_refetches_stale_pages():
+    """Test cached pages older than max_page_age_hours are fetched again"""
+    doc_sync = DocSync(
+        base_url="https://docs.example.com",
+        path_prefix="/",
+        fetching_config=FetchingConfig(max_page_age_hours=12),
+    )
+    fresh_url = HttpUrl("https://docs.example.com/fresh")
+    stale_url = HttpUrl("https://docs.example.com/stale")
+    doc_sync.fetcher.discover_pages = AsyncMock(return_value=[fresh_url, stale_url])
+
+    def cached_page(url: HttpUrl, age: timedelta) -> CachedPage:
+        return CachedPage(
+            url=url,
+            url_hash="a" * 64,
+            fetch_timestamp=datetime.now() - age,
+            content_hash="b" * 64,
+            content_length=10,
+            http_status=200,
+        )
+
+    cache_metadata = CacheMetadata(
+        base_url="https://docs.example.com",
+        last_full_sync=datetime.now(),
+        total_pages=2,
+        pages={
+            str(fresh_url): cached_page(fresh_url, timedelta(hours=1)),
+            str(stale_url): cached_page(stale_url, timedelta(hours=13)),
+        },
+    )
+
+    _, urls_to_fetch = await doc_sync._discover_and_filter_pages(
+        cache_metadata, force_refresh=False, incremental=True
+    )
+
+    assert urls_to_fetch == [stale_url]
+
+
+@pytest.mark.asyncio
+async def test_cached_page_size_counts_utf8_bytes(tmp_path):
+    """Test recorded page sizes are byte counts, not character counts"""
+    doc_sync = DocSync(base_url="https://docs.example.com", path_prefix="/")
+    doc_sync.cache_dir = tmp_path
+    doc_sync.pages_dir.mkdir()
+    url = HttpUrl("https://docs.example.com/cafe")
+    content = "<html><body><main><h1>Café</h1><p>naïve → proxy</p></main></body></html>"
+    cache_metadata = CacheMetadata(
+        base_url="https://docs.example.com", last_full_sync=datetime.now(), total_pages=0
+    )
+
+    size = await doc_sync._process_successful_fetch(
+        FetchResult(url=url, status=200, success=True, content=content, fetch_duration_ms=5),
+        cache_metadata,
+        datetime.now(),
+    )
+
+    cached_page = cache_metadata.pages[str(url)]
+    assert size == cached_page.content_length == len(content.encode("utf-8")) > len(content)
+    assert (doc_sync.pages_dir / f"{cached_page.url_hash}.html").stat().st_size == size
@@ -0,0 +1,53 @@
+"""Unit tests for the embedder"""
+
+import numpy as np
+import onnxruntime
+import pytest
+
+from src.services.embedder import Embedder, _available_providers
+
+
+class _RecordingModel:
+    """Stand-in for TextEmbedding that records the batches it receives"""
+
+    def __init__(self):
+        self.batches: list[list[str]] = []
+
+    def embed(self, texts, batch_size=256):
+        for start in range(0, len(texts), batch_size):
+            self.batches.append(list(texts[start : start + batch_size]))
+        return (np.array([float(len(text))]) for text in texts)
+
+
+@pytest.mark.asyncio
+async def test_embed_batch_groups_by_length_and_keeps_order():
+    """Test texts are batched by length but embeddings come back in input order"""
+    embedder = Embedder.__new__(Embedder)
+    embedder.model = _RecordingModel()
+    texts = ["a" * 50, "b", "c" * 40, "dd", "e" * 45, "fff"]
+
+    embeddings = await embedder.embed_batch(texts, batch_size=3)
+
+    assert embeddings == [[float(len(text))] for text in texts]
+    assert embedder.model.batches == [["b", "dd", "fff"], ["c" * 40, "e" * 45, "a" * 50]]
+
+
+def test_warm_up_runs_the_model_once():
+    """Test warming up embeds a single text through the loaded model"""
+    embedder = Embedder.__new__(Embedder)
+    embedder.model = _RecordingModel()
+
+    embedder.warm_up()
+
+    assert embedder.model.batches == [["warm up"]]
+
+
+def test_available_providers_skips_missing(monkeypatch):
+    """Test unavailable execution providers fall back gracefully"""
+    monkeypatch.setattr(onnxruntime, "get_available_providers", lambda: ["CPUExecutionProvider"])
+
+    assert _available_providers([]) is None
+    assert _available_providers(["CUDAExecutionProvider"]) is None
+    assert _available_providers(["CUDAExecutionProvider", "CPUExecutionProvider"]) == [
+        "CPUExecutionProvider"
+    ]
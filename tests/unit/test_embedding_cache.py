@@ -0,0 +1,37 @@
+"""Unit tests for the embedding cache"""
+
+from src.services.embedding_cache import EmbeddingCache
+
+
+def test_content_key_is_stable():
+    """Test identical content maps to the same key"""
+    assert EmbeddingCache.content_key("hello") == EmbeddingCache.content_key("hello")
+    assert EmbeddingCache.content_key("hello") != EmbeddingCache.content_key("world")
+
+
+def test_put_and_get_many():
+    """Test stored embeddings are returned and unknown keys are skipped"""
+    cache = EmbeddingCache(db_path=":memory:", model_name="test-model")
+    key_a = EmbeddingCache.content_key("a")
+    key_b = EmbeddingCache.content_key("b")
+    embedding = [0.5] * 384
+
+    cache.put_many([(key_a, embedding)])
+    found = cache.get_many([key_a, key_b])
+
+    assert found == {key_a: embedding}
+    cache.close()
+
+
+def test_cache_is_scoped_to_model(tmp_path):
+    """Test embeddings from another model are not returned"""
+    db_path = str(tmp_path / "cache.db")
+    key = EmbeddingCache.content_key("a")
+
+    cache = EmbeddingCache(db_path=db_path, model_name="model-one")
+    cache.put_many([(key, [0.25] * 384)])
+    cache.close()
+
+    other = EmbeddingCache(db_path=db_path, model_name="model-two")
+    assert other.get_many([key]) == {}
+    other.close()
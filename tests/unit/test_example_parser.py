@@ -0,0 +1,68 @@
+"""Unit tests for the YAML and JSON example parser"""
+
+from pathlib import Path
+
+import pytest
+
+from src.services.example_parser import ExampleParser
+
+
+@pytest.mark.asyncio
+async def test_yaml_formatted_structure_matches_sections():
+    """Test the formatted YAML document is the concatenation of its key sections"""
+    content = "# comment\nname: demo\nports: [80, 443]\nenv:\n  DEBUG: 'true'\n"
+
+    parsed = await ExampleParser().parse(Path("config.yaml"), content)
+
+    assert [key for key, _ in parsed.sections] == ["name", "ports", "env"]
+    assert parsed.text.endswith(
+        "Formatted structure:\nname: demo\nports:\n- 80\n- 443\nenv:\n  DEBUG: 'true'\n"
+    )
+
+
+@pytest.mark.asyncio
+async def test_json_formatted_content_matches_sections():
+    """Test the formatted JSON document is rebuilt from its key sections"""
+    content = '{"name": "demo", "ports": [80, 443], "env": {}}'
+
+    parsed = await ExampleParser().parse(Path("config.json"), content)
+
+    assert parsed.sections[1] == ("ports", '{\n  "ports": [\n    80,\n    443\n  ]\n}')
+    assert parsed.text.endswith(
+        'Content:\n{\n  "name": "demo",\n  "ports": [\n    80,\n    443\n  ],\n  "env": {}\n}'
+    )
+    assert parsed.metadata["top_level_keys"] == ["name", "ports", "env"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        ('{"a": "\\ud800x"}', '{\n  "a": "\\ud800x"\n}'),
+        (
+            '{"a": NaN, "b": 123456789012345678901234567890}',
+            '{\n  "a": NaN,\n  "b": 123456789012345678901234567890\n}',
+        ),
+        ('{"b": 123456789012345678901234567890}', '{\n  "b": 123456789012345678901234567890\n}'),
+        ('{"a": Infinity}', '{\n  "a": Infinity\n}'),
+    ],
+)
+async def test_json_outside_orjson_range_is_rendered_faithfully(content, expected):
+    """Test JSON that orjson rejects or would alter is rendered by the stdlib"""
+    parsed = await ExampleParser().parse(Path("config.json"), content)
+
+    assert parsed.metadata["parsed"] is True
+    assert parsed.text.endswith(f"Content:\n{expected}")
+
+
+@pytest.mark.asyncio
+async def test_yaml_with_aliases_keeps_anchors():
+    """Test nodes shared through aliases are anchored in the formatted structure"""
+    content = "base: &defaults\n  retries: 3\nservice: *defaults\n"
+
+    parsed = await ExampleParser().parse(Path("config.yaml"), content)
+
+    assert parsed.text.endswith(
+        "Formatted structure:\nbase: &id001\n  retries: 3\nservice: *id001\n"
+    )
+    assert parsed.sections[1] == ("service", "service:\n  retries: 3\n")
@@ -74,6 +74,54 @@ def test_parse_with_content_div():
     assert parsed.extraction_method == "content_div"
 
 
+def test_content_container_preference_order():
+    """Test <article> beats content divs, and div classes follow their preference order"""
+    parser = HtmlParser()
+
+    html = """
+    <html><body>
+        <div class="content"><h1>Div</h1><p>Div text.</p></div>
+        <article><h1>Article</h1><p>Article text.</p></article>
+    </body></html>
+    """
+    parsed = parser.parse(html, url="https://example.com/page", validation=False)
+    assert parsed.extraction_method == "article_tag"
+    assert "Article text" in parsed.main_content
+    assert "Div text" not in parsed.main_content
+
+    html = """
+    <html><body>
+        <div class="wide markdown-body"><h1>Body</h1><p>Markdown text.</p></div>
+        <div class="main-content"><h1>Main</h1><p>Main text.</p></div>
+    </body></html>
+    """
+    parsed = parser.parse(html, url="https://example.com/page", validation=False)
+    assert parsed.extraction_method == "content_div"
+    assert "Main text" in parsed.main_content
+    assert "Markdown text" not in parsed.main_content
+
+
+def test_parse_utf8_bytes_matches_str():
+    """Test raw UTF-8 bytes parse the same as the decoded string"""
+    html = """
+    <html><body>
+        <main>
+            <h1>Café guide</h1>
+            <p>Configure the naïve proxy → upstream.</p>
+        </main>
+    </body></html>
+    """
+
+    url = "https://example.com/cafe"
+
+    parser = HtmlParser()
+    from_str = parser.parse(html, url=url, validation=False)
+    from_bytes = parser.parse(html.encode("utf-8"), url=url, validation=False)
+
+    assert from_bytes.title == from_str.title == "Café guide"
+    assert from_bytes.main_content == from_str.main_content
+
+
 def test_parse_fallback_strategy():
     """Test fallback extraction when no semantic tags present"""
     html = """
@@ -96,6 +144,26 @@ def test_parse_fallback_strategy():
     assert parsed.extraction_method == "fallback"
 
 
+def test_headings_in_document_order():
+    """Test headings of every level are returned in the order they appear"""
+    html = """
+    <html><body>
+        <main>
+            <h1>Guide</h1>
+            <h2>Install</h2>
+            <h3>Requirements</h3>
+            <h2>Configure</h2>
+            <p>Content here.</p>
+        </main>
+    </body></html>
+    """
+
+    parser = HtmlParser()
+    parsed = parser.parse(html, url="https://example.com/guide", validation=False)
+
+    assert parsed.headings == ["Guide", "Install", "Requirements", "Configure"]
+
+
 def test_extract_links_with_relative_urls():
     """Test link extraction with relative URLs"""
     html = """
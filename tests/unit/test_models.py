@@ -0,0 +1,30 @@
+"""Unit tests for data models"""
+
+import pytest
+from pydantic import ValidationError
+
+from src.models.embedding import VectorEmbedding
+
+
+def test_vector_embedding_packs_float_list():
+    """Test list input is stored as packed float32 bytes"""
+    embedding = VectorEmbedding(chunk_id="abc", embedding=[0.5] * 384, model_name="m")
+
+    assert isinstance(embedding.embedding, bytes)
+    assert len(embedding.embedding) == 384 * 4
+    assert list(embedding.as_array()) == [0.5] * 384
+
+
+def test_vector_embedding_rejects_wrong_dimension():
+    """Test vectors must have 384 dimensions"""
+    with pytest.raises(ValidationError, match="384 dimensions"):
+        VectorEmbedding(chunk_id="abc", embedding=[0.5] * 10, model_name="m")
+
+
+def test_vector_embedding_json_round_trip():
+    """Test raw vector bytes survive JSON serialization"""
+    embedding = VectorEmbedding(chunk_id="abc", embedding=[0.25] * 384, model_name="m")
+
+    restored = VectorEmbedding.model_validate_json(embedding.model_dump_json())
+
+    assert restored.embedding == embedding.embedding
@@ -0,0 +1,39 @@
+"""Unit tests for the search service"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.services.search import SearchService
+
+
+@pytest.fixture
+def search_service():
+    """Create a search service with a mocked embedder"""
+    with patch("src.services.search.Embedder") as mock_embedder_cls:
+        mock_embedder_cls.return_value.embed_text = AsyncMock(return_value=[0.1] * 384)
+        yield SearchService(vector_store=MagicMock())
+
+
+@pytest.mark.asyncio
+async def test_repeated_query_reuses_embedding(search_service):
+    """Test identical queries (up to whitespace) are only embedded once"""
+    first = await search_service._embed_query("how do I  install toolhive")
+    second = await search_service._embed_query(" how do I install toolhive ")
+
+    assert first == second
+    search_service.embedder.embed_text.assert_awaited_once_with("how do I install toolhive")
+
+
+@pytest.mark.asyncio
+async def test_query_embedding_cache_is_bounded(search_service):
+    """Test the least recently used query is evicted once the cache is full"""
+    with patch("src.services.search.config") as mock_config:
+        mock_config.query_embedding_cache_size = 2
+
+        await search_service._embed_query("first")
+        await search_service._embed_query("second")
+        await search_service._embed_query("first")
+        await search_service._embed_query("third")
+
+    assert list(search_service._query_embeddings) == ["first", "third"]
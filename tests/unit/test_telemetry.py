@@ -1,5 +1,7 @@
 """Unit tests for telemetry service"""
 
+import json
+from datetime import UTC, datetime
 from unittest.mock import MagicMock, patch
 
 from src.services.telemetry import TelemetryService
@@ -90,6 +92,56 @@ class TestTelemetryService:
             response={"results": []},
         )
 
+    @patch("src.services.telemetry.config")
+    def test_log_query_skips_response_supplier_when_disabled(self, mock_config):
+        """Test a lazy response is never built when logging is disabled"""
+        mock_config.otel_enabled = False
+        mock_config.otel_tracing_enabled = False
+
+        service = TelemetryService()
+        supplier = MagicMock(return_value={"results": []})
+        service.log_query(
+            tool_name="query_docs",
+            query="test query",
+            parameters={"limit": 5},
+            response=supplier,
+        )
+
+        supplier.assert_not_called()
+
+    @patch("src.services.telemetry.config")
+    @patch("src.services.telemetry.set_logger_provider")
+    def test_log_query_with_response_supplier(self, mock_set_logger_provider, mock_config):
+        """Test a lazy response is built once when logging is enabled"""
+        mock_config.otel_enabled = True
+        mock_config.otel_tracing_enabled = False
+        mock_config.otel_endpoint = "http://localhost:4318"
+        mock_config.otel_service_name = "test-service"
+        mock_config.otel_service_version = "1.0.0"
+
+        mock_otel_logger = MagicMock()
+
+        service = TelemetryService()
+        service.otel_logger = mock_otel_logger
+
+        supplier = MagicMock(
+            return_value={
+                "results": [{"chunk": {"id": "123"}, "score": 0.75}],
+                "query_info": {"query_time_ms": 3.0, "total_results": 1},
+            }
+        )
+        service.log_query(
+            tool_name="query_docs",
+            query="test query",
+            parameters={"limit": 5},
+            response=supplier,
+        )
+
+        supplier.assert_called_once_with()
+        attrs = mock_otel_logger.emit.call_args.kwargs["attributes"]
+        assert attrs["response.result_count"] == 1
+        assert attrs["response.top_score"] == 0.75
+
     @patch("src.services.telemetry.config")
     @patch("src.services.telemetry.set_logger_provider")
     def test_log_query_with_response(self, mock_set_logger_provider, mock_config):
@@ -138,6 +190,39 @@ class TestTelemetryService:
         assert "query.text" not in attrs
         assert "query.length" not in attrs
 
+    @patch("src.services.telemetry.config")
+    @patch("src.services.telemetry.set_logger_provider")
+    def test_log_query_serializes_full_results(self, mock_set_logger_provider, mock_config):
+        """Test response size and full results JSON are recorded"""
+        mock_config.otel_enabled = True
+        mock_config.otel_tracing_enabled = False
+        mock_config.otel_endpoint = "http://localhost:4318"
+        mock_config.otel_service_name = "test-service"
+        mock_config.otel_service_version = "1.0.0"
+        mock_config.otel_log_full_results = True
+
+        mock_otel_logger = MagicMock()
+
+        service = TelemetryService()
+        service.otel_logger = mock_otel_logger
+
+        created_at = datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC)
+        response = {
+            "results": [{"chunk": {"id": "123", "created_at": created_at}, "score": 0.5}],
+            "query_info": {"query_time_ms": 1.0, "total_results": 1},
+        }
+        service.log_query(
+            tool_name="query_docs",
+            query="test query",
+            parameters={"limit": 5},
+            response=response,
+        )
+
+        attrs = mock_otel_logger.emit.call_args.kwargs["attributes"]
+        results = json.loads(attrs["response.results_json"])
+        assert results[0]["chunk"]["created_at"] == str(created_at)
+        assert attrs["response.size_bytes"] > len(attrs["response.results_json"])
+
     @patch("src.services.telemetry.config")
     @patch("src.services.telemetry.set_logger_provider")
     def test_log_query_with_error(self, mock_set_logger_provider, mock_config):